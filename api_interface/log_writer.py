@@ -0,0 +1,117 @@
+"""
+Buffered log writer shared by the XLAPI mock and RobotReceiver.
+- Keeps one persistent file descriptor per log path instead of open/write/close per line
+- Lines are encoded at enqueue time and written as one vectored os.writev batch
+- Flushes at MAX_BATCH_SIZE lines, MAX_BATCH_BYTES bytes or FLUSH_INTERVAL_SEC seconds
+- Flushes and closes at interpreter exit so no buffered lines are lost
+- Log timestamps are formatted at most once per second
+"""
+import os
+import atexit
+import threading
+from time import strftime, gmtime, time as _time
+
+MAX_BATCH_SIZE = 1000           # lines per batch (kept below the Linux IOV_MAX of 1024)
+MAX_BATCH_BYTES = 64 * 1024     # bytes per batch
+FLUSH_INTERVAL_SEC = 1.0        # max age of an unflushed line
+
+_writers = {}
+_writers_lock = threading.Lock()
+
+# (epoch second, formatted string) of the last timestamp produced
+_ts_cache = (0, '')
+
+
+def utc_timestamp():
+    """Return the current UTC time as 'YYYY-MM-DD HH:MM:SS', cached per second."""
+    global _ts_cache
+    now = int(_time())
+    cached_sec, cached_str = _ts_cache
+    if now != cached_sec:
+        cached_str = strftime('%Y-%m-%d %H:%M:%S', gmtime(now))
+        _ts_cache = (now, cached_str)
+    return cached_str
+
+
+def _write_all(fd, chunks):
+    """Write a list of byte strings to fd, using one writev syscall where possible."""
+    if hasattr(os, 'writev'):
+        written = os.writev(fd, chunks)
+        total = sum(len(chunk) for chunk in chunks)
+        if written == total:
+            return
+        data = b''.join(chunks)[written:]
+    else:
+        data = b''.join(chunks)
+    while data:
+        data = data[os.write(fd, data):]
+
+
+class LogWriter:
+    """
+    Append-only, thread-safe log file writer that batches lines into vectored writes.
+    """
+    def __init__(self, path, max_batch_size=MAX_BATCH_SIZE, max_batch_bytes=MAX_BATCH_BYTES,
+                 flush_interval=FLUSH_INTERVAL_SEC):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.max_batch_size = max_batch_size
+        self.max_batch_bytes = max_batch_bytes
+        self.flush_interval = flush_interval
+        self._fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._lock = threading.Lock()
+        self._pending = []
+        self._pending_bytes = 0
+        self._timer = None
+        atexit.register(self.close)
+
+    def write(self, line):
+        """Queue one log line (including its trailing newline)."""
+        data = line.encode('utf-8')
+        with self._lock:
+            if self._fd is None:
+                return
+            self._pending.append(data)
+            self._pending_bytes += len(data)
+            if (len(self._pending) >= self.max_batch_size or
+                    self._pending_bytes >= self.max_batch_bytes):
+                self._flush_locked()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        """Write all queued lines through to the file."""
+        with self._lock:
+            if self._fd is not None:
+                self._flush_locked()
+
+    def close(self):
+        """Flush remaining lines and close the file descriptor."""
+        with self._lock:
+            if self._fd is not None:
+                self._flush_locked()
+                os.close(self._fd)
+                self._fd = None
+
+    def _flush_locked(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._pending:
+            _write_all(self._fd, self._pending)
+            self._pending = []
+            self._pending_bytes = 0
+
+
+def get_log_writer(path):
+    """Return the shared LogWriter for a path, creating it on first use."""
+    key = os.path.abspath(path)
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None:
+            writer = _writers[key] = LogWriter(path)
+        return writer
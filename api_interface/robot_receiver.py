@@ -1,20 +1,62 @@
 """
 RobotReceiver - Simulates a receiver/robotic arm for a LEO satellite emulator.
 - Receives signal and antenna data via XLAPI
-- Logs to data/logs/receiver_log.txt
+- Logs to data/logs/receiver_log.txt (threshold set by the RX_LOG_LEVEL env var)
 - Simulates antenna movement with slew rate
 - Outputs lock status based on SNR and pointing error
 """
 import os
 import sys
-import time
+import math
+import logging
+import functools
 import yaml
-from datetime import datetime
 from api_interface.xlapi_mock import XLAPI
+from api_interface.log_writer import get_log_writer, utc_timestamp
 
 LOG_PATH = 'data/logs/receiver_log.txt'
 CONFIG_PATH = 'config/sim_config.yaml'
 
+
+def _parse_log_level(value):
+    """Turn a level number or name (e.g. '30', 'warning') into a logging level; INFO if unknown."""
+    value = str(value).strip()
+    if value.lstrip('-').isdigit():
+        return int(value)
+    level = logging.getLevelName(value.upper())
+    return level if isinstance(level, int) else logging.INFO
+
+
+# Messages below this level are dropped; set e.g. RX_LOG_LEVEL=WARNING (or 30) to skip per-frame logs
+LOG_LEVEL = _parse_log_level(os.environ.get('RX_LOG_LEVEL', logging.INFO))
+
+# Prefer the LibYAML-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+def _clamp(x, lim):
+    """Clamp x to [-lim, lim] with plain comparisons (no min/max calls)."""
+    return lim if x > lim else -lim if x < -lim else x
+
+
+def _fmt2(value):
+    """Format a number with 2 decimals; other values fall back to str() so logging never raises."""
+    try:
+        return f"{value:.2f}"
+    except (TypeError, ValueError):
+        return str(value)
+
+
+@functools.lru_cache(maxsize=1)
+def _read_config(path):
+    """Parse the YAML config once per path; later receivers reuse the result."""
+    with open(path, 'rb') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
 class RobotReceiver:
     """
     Simulates a receiver/robotic arm for a LEO satellite emulator.
@@ -28,35 +70,39 @@ class RobotReceiver:
         self.beamwidth = 10.0  # deg default
         self.last_snr = 0.0
         self.last_pointing_error = 999.0
+        self._last_status = None
+        self._log_level = LOG_LEVEL
+        self._log_writer = get_log_writer(LOG_PATH)
         self._load_config()
-        os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
 
     def _load_config(self):
         """Load slew rate and beamwidth from config."""
         try:
-            with open(CONFIG_PATH, 'r') as f:
-                config = yaml.safe_load(f)
+            config = _read_config(CONFIG_PATH)
             antenna = config.get('antenna', {})
             self.slew_rate = float(antenna.get('slew_rate_deg_s', 5.0))
             self.beamwidth = float(antenna.get('beamwidth_deg', 10.0))
         except Exception as e:
-            self._log(f"Error loading config: {e}")
+            self._log(f"Error loading config: {e}", logging.ERROR)
 
-    def _log(self, message):
-        """Log a message with timestamp to the receiver log file."""
-        timestamp = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
-        with open(LOG_PATH, 'a') as f:
-            f.write(f'[{timestamp}] {message}\n')
+    def _log(self, message, level=logging.INFO):
+        """Log a message with timestamp to the receiver log file, if level passes the threshold."""
+        if level < self._log_level:
+            return
+        timestamp = utc_timestamp()
+        self._log_writer.write(f'[{timestamp}] {message}\n')
 
     def receive_signal(self):
         """Receive signal data from XLAPI (thread-safe)."""
         try:
             data = self.xlapi.signal_queue.get(timeout=1)
             self.last_snr = data['snr']
-            self._log(f"Received signal: {data}")
+            # Fixed-field record instead of the dict repr: shorter and easy to parse
+            self._log(f"SIG t={data.get('time')} dop={_fmt2(data.get('doppler'))} "
+                      f"snr={_fmt2(data.get('snr'))}")
             return data
         except Exception as e:
-            self._log(f"Error receiving signal: {e}")
+            self._log(f"Error receiving signal: {e}", logging.ERROR)
             return None
 
     def receive_antenna(self):
@@ -68,19 +114,19 @@ class RobotReceiver:
             # Simulate antenna movement with slew rate
             az_diff = target_az - self.current_az
             el_diff = target_el - self.current_el
-            az_step = max(min(az_diff, self.slew_rate), -self.slew_rate)
-            el_step = max(min(el_diff, self.slew_rate), -self.slew_rate)
+            az_step = _clamp(az_diff, self.slew_rate)
+            el_step = _clamp(el_diff, self.slew_rate)
             self.current_az += az_step
             self.current_el += el_step
             self._log(f"Moved antenna to: az={self.current_az:.2f}, el={self.current_el:.2f}")
             return {'azimuth': self.current_az, 'elevation': self.current_el}
         except Exception as e:
-            self._log(f"Error receiving antenna: {e}")
+            self._log(f"Error receiving antenna: {e}", logging.ERROR)
             return None
 
     def compute_pointing_error(self, target_az, target_el):
         """Compute pointing error in degrees."""
-        error = ((self.current_az - target_az)**2 + (self.current_el - target_el)**2) ** 0.5
+        error = math.hypot(self.current_az - target_az, self.current_el - target_el)
         self.last_pointing_error = error
         return error
 
@@ -93,7 +139,11 @@ class RobotReceiver:
             status = 'Locked on satellite'
         else:
             status = 'Signal lost'
-        self._log(f"Status: {status} (SNR={self.last_snr}, error={self.last_pointing_error})")
+        # Only lock/lost transitions are logged, not every status poll
+        if status != self._last_status:
+            self._last_status = status
+            self._log(f"Status: {status} (SNR={self.last_snr}, error={self.last_pointing_error})",
+                      logging.WARNING)
         return status
 
 # Example usage (for testing)
@@ -1,36 +1,105 @@
 """
 XLAPI Mock - Emulates a control interface for a LEO satellite emulator.
-- Thread-safe real-time data streaming using queue.Queue
-- Logs all commands and responses
+- Real-time data streaming over SPSC ring buffers (no lock on the consumer side)
+- Logs all commands and responses through a shared buffered log writer
 - Error handling for invalid inputs
 """
-import os
 import sys
 import queue
 import threading
-from datetime import datetime
+from collections import deque
+from time import monotonic
+from api_interface.log_writer import get_log_writer, utc_timestamp
 
 LOG_PATH = 'data/logs/api_log.txt'
+QUEUE_CAPACITY = 4096  # preallocated ring slots per signal/antenna stream
+
+class SPSCRingBuffer:
+    """
+    Preallocated single-producer/single-consumer ring buffer.
+    Exactly one thread may call put() and one thread get() at a time: the producer
+    only advances _tail and the consumer only advances _head, and under CPython each
+    index update is a single atomic store, so no lock is taken on the hot path.
+    Callers with several producer threads must serialize put() (XLAPI does).
+    Items arriving while the ring is full spill into an overflow deque instead of
+    being refused, so like queue.Queue the buffer is unbounded unless maxsize > 0.
+    A threading.Event is used only to wake a consumer waiting on an empty buffer.
+    Mirrors the put/get(timeout) interface of queue.Queue, including queue.Full
+    and queue.Empty.
+    """
+    def __init__(self, capacity=QUEUE_CAPACITY, maxsize=0):
+        self._capacity = capacity
+        self._maxsize = maxsize
+        self._buf = [None] * capacity
+        self._head = 0
+        self._tail = 0
+        self._overflow = deque()
+        self._ready = threading.Event()
+
+    def put(self, item):
+        """Store an item and wake the consumer; raises queue.Full only when maxsize is reached."""
+        if self._maxsize > 0 and self.qsize() >= self._maxsize:
+            raise queue.Full('Ring buffer full')
+        tail = self._tail
+        # Once items have spilled, keep spilling until the consumer drains them (FIFO order)
+        if self._overflow or tail - self._head >= self._capacity:
+            self._overflow.append(item)
+        else:
+            self._buf[tail % self._capacity] = item
+            self._tail = tail + 1
+        self._ready.set()
+
+    def get(self, timeout=None):
+        """Pop the oldest item, waiting up to timeout seconds; raises queue.Empty."""
+        deadline = None if timeout is None else monotonic() + timeout
+        while self._head == self._tail and not self._overflow:
+            self._ready.clear()
+            # Re-check after clearing so a concurrent put is never missed
+            if self._head != self._tail or self._overflow:
+                break
+            remaining = None if deadline is None else deadline - monotonic()
+            if (remaining is not None and remaining <= 0) or not self._ready.wait(remaining):
+                raise queue.Empty
+        head = self._head
+        if head == self._tail:
+            # Ring drained; spilled items are all newer than ring items
+            return self._overflow.popleft()
+        idx = head % self._capacity
+        item = self._buf[idx]
+        self._buf[idx] = None
+        self._head = head + 1
+        return item
+
+    def qsize(self):
+        """Return the number of queued items."""
+        return self._tail - self._head + len(self._overflow)
+
+    def empty(self):
+        """Return True if no items are queued."""
+        return self._tail == self._head and not self._overflow
+
 
 class XLAPI:
     """
     Mock XLAPI interface for LEO satellite emulator.
     Provides methods to send signal data, set antenna position, and get receiver status.
-    Uses a thread-safe queue for real-time data streaming.
+    Uses a single-producer/single-consumer ring buffer per stream for real-time data streaming:
+    the send methods may be called from any thread, but each queue must have one consumer.
     """
     def __init__(self):
-        self.signal_queue = queue.Queue()
-        self.antenna_queue = queue.Queue()
+        self.signal_queue = SPSCRingBuffer()
+        self.antenna_queue = SPSCRingBuffer()
         self.status = 'Idle'
         self.lock = threading.Lock()
-        os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
+        # One producer per ring: these serialize put() across caller threads
+        self._signal_put_lock = threading.Lock()
+        self._antenna_put_lock = threading.Lock()
+        self._log_writer = get_log_writer(LOG_PATH)
 
     def log(self, message):
         """Log a message with timestamp to the API log file."""
-        timestamp = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
-        with self.lock:
-            with open(LOG_PATH, 'a') as f:
-                f.write(f'[{timestamp}] {message}\n')
+        timestamp = utc_timestamp()
+        self._log_writer.write(f'[{timestamp}] {message}\n')
 
     def send_signal_data(self, t, doppler, snr):
         """
@@ -45,7 +114,8 @@ class XLAPI:
         try:
             if snr < 0:
                 raise ValueError('SNR cannot be negative')
-            self.signal_queue.put({'time': t, 'doppler': doppler, 'snr': snr})
+            with self._signal_put_lock:
+                self.signal_queue.put({'time': t, 'doppler': doppler, 'snr': snr})
             self.log(f'Sent signal data: t={t}, doppler={doppler}, snr={snr}')
             self.status = 'Locked' if snr > 10 else 'Signal lost'
             return True
@@ -67,7 +137,8 @@ class XLAPI:
                 raise ValueError('Azimuth out of range (0-360)')
             if not (0 <= el <= 90):
                 raise ValueError('Elevation out of range (0-90)')
-            self.antenna_queue.put({'azimuth': az, 'elevation': el})
+            with self._antenna_put_lock:
+                self.antenna_queue.put({'azimuth': az, 'elevation': el})
             self.log(f'Set antenna: az={az}, el={el}')
             return True
         except Exception as e:
@@ -6,61 +6,125 @@ Cleanup script for LEO Flyby Signal Emulator
 - Ensures proper project structure
 """
 import os
+import re
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 import shutil
-import glob
+import fnmatch
+
+# Files and directories to remove, matched by name anywhere in the tree
+CLEANUP_PATTERNS = [
+    # Python cache directories
+    "__pycache__",
+    "*.pyc",
+    "*.pyo",
+    
+    # Generated data (optional - uncomment if you want to remove)
+    # "data/plots/*.png",
+    # "data/plots/*.html", 
+    # "data/logs/*.csv",
+    # "data/logs/*.txt",
+    
+    # Temporary files
+    "*.tmp",
+    "*.temp",
+    ".DS_Store",
+    "Thumbs.db",
+    
+    # IDE files
+    "*.swp",
+    "*.swo",
+    
+    # Backup files
+    "*.bak",
+    "*.backup",
+    "*~"
+]
+
+# Files and directories to remove, matched by name at the project root only
+ROOT_CLEANUP_PATTERNS = [
+    ".pytest_cache",
+    ".vscode",
+    ".idea"
+]
+
+# Worker threads used to overlap the unlink/rmtree syscalls
+DELETE_WORKERS = 8
+
+
+def _compile_patterns(patterns):
+    """Compile glob-style name patterns into one regex."""
+    return re.compile('|'.join(fnmatch.translate(p) for p in patterns))
+
+
+def _find_cleanup_targets(root='.'):
+    """
+    Walk the tree once and collect entries whose names match the cleanup patterns.
+    
+    Like glob's "**", wildcards do not match dot-names and hidden directories are
+    not descended into. Matching directories are collected and not descended into.
+    
+    Returns:
+        list: (path, is_dir) tuples
+    """
+    # Wildcards never match a leading dot, so dot-names only match literal dot patterns
+    visible_re = _compile_patterns(CLEANUP_PATTERNS)
+    hidden_re = _compile_patterns([p for p in CLEANUP_PATTERNS if p.startswith('.')])
+    root_re = _compile_patterns(ROOT_CLEANUP_PATTERNS)
+    
+    targets = []
+    stack = ['']
+    while stack:
+        rel_dir = stack.pop()
+        try:
+            with os.scandir(os.path.join(root, rel_dir) if rel_dir else root) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            name = entry.name
+            rel_path = os.path.join(rel_dir, name) if rel_dir else name
+            is_dir = entry.is_dir(follow_symlinks=False)
+            name_re = hidden_re if name.startswith('.') else visible_re
+            if name_re.match(name) or (not rel_dir and root_re.match(name)):
+                targets.append((rel_path, is_dir))
+            elif is_dir and not name.startswith('.'):
+                stack.append(rel_path)
+    return targets
+
+
+def _delete(target):
+    """
+    Remove one cleanup target.
+    
+    Args:
+        target: (path, is_dir) tuple from _find_cleanup_targets
+    
+    Returns:
+        tuple: (message, removed) where removed is True on success
+    """
+    path, is_dir = target
+    try:
+        if is_dir:
+            shutil.rmtree(path)
+            return f"  🗑️  Removed directory: {path}", True
+        os.remove(path)
+        return f"  🗑️  Removed file: {path}", True
+    except Exception as e:
+        return f"  ⚠️  Could not remove {path}: {e}", False
+
 
 def cleanup_project():
     """Clean up the project directory structure."""
     print("🧹 Starting project cleanup...")
     
-    # Files and directories to remove
-    cleanup_items = [
-        # Python cache directories
-        "**/__pycache__",
-        "**/*.pyc",
-        "**/*.pyo",
-        ".pytest_cache",
-        
-        # Generated data (optional - uncomment if you want to remove)
-        # "data/plots/*.png",
-        # "data/plots/*.html", 
-        # "data/logs/*.csv",
-        # "data/logs/*.txt",
-        
-        # Temporary files
-        "**/*.tmp",
-        "**/*.temp",
-        "**/.DS_Store",
-        "**/Thumbs.db",
-        
-        # IDE files
-        ".vscode",
-        ".idea",
-        "**/*.swp",
-        "**/*.swo",
-        
-        # Backup files
-        "**/*.bak",
-        "**/*.backup",
-        "**/*~"
-    ]
-    
     removed_count = 0
     
-    for pattern in cleanup_items:
-        matches = glob.glob(pattern, recursive=True)
-        for match in matches:
-            try:
-                if os.path.isfile(match):
-                    os.remove(match)
-                    print(f"  🗑️  Removed file: {match}")
-                    removed_count += 1
-                elif os.path.isdir(match):
-                    shutil.rmtree(match)
-                    print(f"  🗑️  Removed directory: {match}")
-                    removed_count += 1
-            except Exception as e:
-                print(f"  ⚠️  Could not remove {match}: {e}")
+    # Targets never overlap (matched directories are not descended into), so they can be deleted concurrently
+    with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+        for message, removed in executor.map(_delete, _find_cleanup_targets()):
+            print(message)
+            removed_count += removed
     
     print(f"\n✅ Cleanup complete! Removed {removed_count} items.")
     
@@ -95,13 +159,10 @@ def check_dependencies():
     missing_packages = []
     
     for package in required_packages:
-        try:
-            if package == 'yaml':
-                import yaml
-            else:
-                __import__(package)
+        # Locate the package without importing (and executing) it
+        if importlib.util.find_spec(package) is not None:
             print(f"  ✅ {package}")
-        except ImportError:
+        else:
             print(f"  ❌ {package} (missing)")
             missing_packages.append(package)
     
@@ -1,15 +1,17 @@
 """
-Dependency-free LEO Satellite Flyby Emulator Demo
+NumPy-only LEO Satellite Flyby Emulator Demo
 - Simplified two-body orbit model (circular orbit, 500 km altitude)
 - Basic signal calculations (Doppler, path loss, SNR)
 - Antenna tracking simulation with fixed beamwidth
-- Uses only standard Python libraries and Matplotlib
+- Uses NumPy for the vectorized simulation and Matplotlib for plots
 - Outputs plots to data/plots/
 """
 import math
-import random
 import os
-from datetime import datetime, timedelta
+
+import numpy as np
+
+from flyby_kernel import simulate as simulate_kernel
 
 # Configuration dictionary
 CONFIG = {
@@ -38,6 +40,35 @@ CONFIG = {
 
 # Constants
 C = 299792458  # Speed of light in m/s
+_INV_C = 1.0 / C  # multiply instead of dividing by C
+
+# Range-independent terms, precomputed for the configured carrier frequency
+_FREQ = CONFIG['signal']['frequency_hz']
+_FSPL_K = 20 * math.log10(4 * math.pi / C)
+_PATH_LOSS_CONST = 20 * math.log10(_FREQ) + _FSPL_K
+_DOPPLER_K = _FREQ * _INV_C
+_SQRT2 = math.sqrt(2)
+
+# Shared generator for the simulated antenna pointing offsets
+_rng = np.random.default_rng()
+
+# Per-timestep simulation record (one field per column, struct-of-arrays access)
+RESULT_DTYPE = np.dtype([
+    ('time_sec', 'f8'),
+    ('range_km', 'f8'),
+    ('elevation_deg', 'f8'),
+    ('azimuth_deg', 'f8'),
+    ('doppler_hz', 'f8'),
+    ('path_loss_db', 'f8'),
+    ('snr_db', 'f8'),
+    ('antenna_az', 'f8'),
+    ('antenna_el', 'f8'),
+    ('pointing_error', 'f8'),
+    ('in_beam', '?'),
+    # Ground track, filled by run_simulation itself (not by the compiled kernel)
+    ('latitude_deg', 'f8'),
+    ('longitude_deg', 'f8'),
+])
 
 
 def calculate_satellite_position(time_sec, config):
@@ -45,11 +76,12 @@ def calculate_satellite_position(time_sec, config):
     Calculate satellite position using simplified circular orbit model.
     
     Args:
-        time_sec: Time in seconds from start
+        time_sec: Time in seconds from start (scalar or NumPy array)
         config: Configuration dictionary
     
     Returns:
-        dict: Satellite position (lat, lon, altitude, range, azimuth, elevation)
+        dict: Satellite position (lat, lon, altitude, range, azimuth, elevation),
+              with array values when time_sec is an array
     """
     # Simplified circular orbit calculation
     # Assume satellite moves in a circular orbit at fixed altitude
@@ -63,7 +95,7 @@ def calculate_satellite_position(time_sec, config):
     angular_velocity = config['satellite']['velocity_km_s'] / orbital_radius  # rad/s
     
     # Satellite position (simplified - assume starts at longitude 0)
-    satellite_lon = (angular_velocity * time_sec) * 180 / math.pi  # Convert to degrees
+    satellite_lon = np.degrees(angular_velocity * np.asarray(time_sec, dtype=np.float64))
     satellite_lat = 0  # Assume equatorial orbit for simplicity
     
     # Ground station position
@@ -75,15 +107,13 @@ def calculate_satellite_position(time_sec, config):
     lon_diff = satellite_lon - gs_lon
     
     # Simplified range calculation
-    range_km = math.sqrt((lat_diff * 111)**2 + (lon_diff * 111)**2 + altitude_km**2)
+    range_km = np.hypot(np.hypot(lat_diff * 111, lon_diff * 111), altitude_km)
     
-    # Simplified azimuth and elevation
-    azimuth = math.atan2(lon_diff, lat_diff) * 180 / math.pi
-    if azimuth < 0:
-        azimuth += 360
+    # Simplified azimuth and elevation (azimuth wrapped to [0, 360))
+    azimuth = np.mod(np.degrees(np.arctan2(lon_diff, lat_diff)), 360)
     
     # Simplified elevation calculation
-    elevation = math.asin(altitude_km / range_km) * 180 / math.pi
+    elevation = np.degrees(np.arcsin(altitude_km / range_km))
     
     return {
         'latitude_deg': satellite_lat,
@@ -95,38 +125,40 @@ def calculate_satellite_position(time_sec, config):
     }
 
 
-def calculate_doppler_shift(velocity_km_s, frequency_hz):
+def calculate_doppler_shift(velocity_km_s, frequency_hz=_FREQ):
     """
     Calculate Doppler shift in Hz.
     
     Args:
         velocity_km_s: Radial velocity in km/s
-        frequency_hz: Carrier frequency in Hz
+        frequency_hz: Carrier frequency in Hz (default: configured frequency)
     
     Returns:
         float: Doppler shift in Hz
     """
-    velocity_m_s = velocity_km_s * 1000
-    doppler_shift = (velocity_m_s / C) * frequency_hz
+    doppler_k = _DOPPLER_K if frequency_hz == _FREQ else frequency_hz * _INV_C
+    doppler_shift = velocity_km_s * 1000 * doppler_k
     return doppler_shift
 
 
-def calculate_path_loss(range_km, frequency_hz):
+def calculate_path_loss(range_km, frequency_hz=_FREQ):
     """
     Calculate free-space path loss in dB.
     
     Args:
-        range_km: Distance in km
-        frequency_hz: Carrier frequency in Hz
+        range_km: Distance in km (scalar or NumPy array)
+        frequency_hz: Carrier frequency in Hz (default: configured frequency)
     
     Returns:
         float: Path loss in dB
     """
     range_m = range_km * 1000
-    # FSPL = 20*log10(d) + 20*log10(f) + 20*log10(4π/c)
-    path_loss = (20 * math.log10(range_m) + 
-                 20 * math.log10(frequency_hz) + 
-                 20 * math.log10(4 * math.pi / C))
+    # FSPL = 20*log10(d) + 20*log10(f) + 20*log10(4π/c); only the first term varies per sample
+    if frequency_hz == _FREQ:
+        path_loss_const = _PATH_LOSS_CONST
+    else:
+        path_loss_const = 20 * math.log10(frequency_hz) + _FSPL_K
+    path_loss = 20 * np.log10(range_m) + path_loss_const
     return path_loss
 
 
@@ -148,98 +180,98 @@ def calculate_snr(tx_power_dbm, tx_gain_db, rx_gain_db, path_loss_db):
     return snr
 
 
-def simulate_antenna_tracking(satellite_pos, config):
-    """
-    Simulate antenna tracking with fixed beamwidth.
-    
-    Args:
-        satellite_pos: Satellite position dictionary
-        config: Configuration dictionary
-    
-    Returns:
-        dict: Antenna tracking results
-    """
-    # Simplified antenna tracking (assume perfect tracking with some error)
-    beamwidth = config['antenna']['beamwidth_deg']
-    
-    # Add small pointing error
-    pointing_error = random.uniform(-1, 1)  # ±1 degree error
-    
-    antenna_az = satellite_pos['azimuth_deg'] + pointing_error
-    antenna_el = satellite_pos['elevation_deg'] + pointing_error
-    
-    # Calculate pointing error
-    az_error = abs(antenna_az - satellite_pos['azimuth_deg'])
-    el_error = abs(antenna_el - satellite_pos['elevation_deg'])
-    total_error = math.sqrt(az_error**2 + el_error**2)
-    
-    # Check if in beam
-    in_beam = total_error < beamwidth / 2
-    
-    return {
-        'antenna_az_deg': antenna_az,
-        'antenna_el_deg': antenna_el,
-        'pointing_error_deg': total_error,
-        'in_beam': in_beam
-    }
-
-
 def run_simulation(config):
     """
     Run complete LEO flyby simulation.
     
+    All timesteps are computed at once, with the compiled Numba kernel when
+    available and whole-array NumPy otherwise; samples below the horizon
+    carry NaN signal metrics and a 999° pointing-error sentinel.
+    
     Args:
         config: Configuration dictionary
     
     Returns:
-        list: Simulation results
+        np.ndarray: Simulation results as a RESULT_DTYPE structured array
     """
     print("Starting LEO Flyby Simulation...")
     print(f"Duration: {config['duration_sec']} seconds ({config['duration_sec']/60:.1f} minutes)")
     print(f"Time step: {config['time_step_sec']} seconds")
     
-    results = []
-    
-    for t in range(0, config['duration_sec'] + 1, config['time_step_sec']):
-        # Calculate satellite position
-        sat_pos = calculate_satellite_position(t, config)
-        
-        # Skip if below horizon
-        if sat_pos['elevation_deg'] < 0:
-            results.append({
-                'time_sec': t,
-                'satellite': sat_pos,
-                'signal': {'doppler_hz': None, 'path_loss_db': None, 'snr_db': None},
-                'antenna': {'antenna_az_deg': 0, 'antenna_el_deg': 0, 'pointing_error_deg': 999, 'in_beam': False}
-            })
-            continue
-        
-        # Calculate signal parameters
-        # Simplified velocity calculation (assume constant radial velocity)
-        velocity_km_s = config['satellite']['velocity_km_s'] * 0.7  # Approximate radial component
-        
-        doppler_hz = calculate_doppler_shift(velocity_km_s, config['signal']['frequency_hz'])
-        path_loss_db = calculate_path_loss(sat_pos['range_km'], config['signal']['frequency_hz'])
-        snr_db = calculate_snr(
-            config['signal']['tx_power_dbm'],
-            config['signal']['tx_gain_db'],
-            config['signal']['rx_gain_db'],
-            path_loss_db
+    times = np.arange(0, config['duration_sec'] + 1, config['time_step_sec'], dtype=np.float64)
+    results = np.empty(len(times), dtype=RESULT_DTYPE)
+    results['time_sec'] = times
+    
+    # Resolve the nested config lookups once (as floats, matching the kernel signature)
+    satellite = config['satellite']
+    signal = config['signal']
+    altitude_km = float(satellite['altitude_km'])
+    earth_radius_km = float(satellite['earth_radius_km'])
+    velocity_km_s = float(satellite['velocity_km_s'])
+    gs_lat = float(config['ground_station']['latitude_deg'])
+    gs_lon = float(config['ground_station']['longitude_deg'])
+    frequency_hz = float(signal['frequency_hz'])
+    tx_power_dbm = float(signal['tx_power_dbm'])
+    tx_gain_db = float(signal['tx_gain_db'])
+    rx_gain_db = float(signal['rx_gain_db'])
+    beamwidth_deg = float(config['antenna']['beamwidth_deg'])
+    
+    # Ground track: equatorial orbit starting at longitude 0, as in calculate_satellite_position
+    results['latitude_deg'] = 0.0
+    results['longitude_deg'] = np.degrees(velocity_km_s / (earth_radius_km + altitude_km) * times)
+    
+    # Antenna pointing offset (±1 degree), one draw per timestep, applied to both axes
+    pointing_offsets = _rng.uniform(-1, 1, size=len(times))
+    
+    if simulate_kernel is not None:
+        # Numba fast path: one fused, compiled pass over all timesteps
+        columns = simulate_kernel(
+            times, altitude_km, earth_radius_km, velocity_km_s, gs_lat, gs_lon,
+            frequency_hz, tx_power_dbm, tx_gain_db, rx_gain_db, beamwidth_deg,
+            pointing_offsets
         )
-        
-        # Simulate antenna tracking
-        antenna_data = simulate_antenna_tracking(sat_pos, config)
-        
-        results.append({
-            'time_sec': t,
-            'satellite': sat_pos,
-            'signal': {
-                'doppler_hz': doppler_hz,
-                'path_loss_db': path_loss_db,
-                'snr_db': snr_db
-            },
-            'antenna': antenna_data
-        })
+        # Kernel columns follow time_sec in RESULT_DTYPE order, up to in_beam
+        for name, column in zip(RESULT_DTYPE.names[1:], columns):
+            results[name] = column
+        print(f"Simulation completed. Generated {len(results)} data points.")
+        return results
+    
+    # Calculate satellite position
+    sat_pos = calculate_satellite_position(times, config)
+    visible = sat_pos['elevation_deg'] >= 0
+    
+    # Calculate signal parameters
+    # Simplified velocity calculation (assume constant radial velocity)
+    radial_velocity_km_s = velocity_km_s * 0.7  # Approximate radial component
+    
+    doppler_hz = calculate_doppler_shift(radial_velocity_km_s, frequency_hz)
+    path_loss_db = calculate_path_loss(sat_pos['range_km'], frequency_hz)
+    snr_db = calculate_snr(tx_power_dbm, tx_gain_db, rx_gain_db, path_loss_db)
+    
+    # Simulate antenna tracking: the same offset on az and el gives |offset|*sqrt(2) total error
+    pointing_error = np.abs(pointing_offsets) * _SQRT2
+    in_beam = pointing_error < beamwidth_deg / 2
+    
+    # Write straight into the preallocated columns, then overwrite hidden samples
+    results['range_km'] = sat_pos['range_km']
+    results['elevation_deg'] = sat_pos['elevation_deg']
+    results['azimuth_deg'] = sat_pos['azimuth_deg']
+    results['doppler_hz'] = doppler_hz
+    results['path_loss_db'] = path_loss_db
+    results['snr_db'] = snr_db
+    results['antenna_az'] = sat_pos['azimuth_deg'] + pointing_offsets
+    results['antenna_el'] = sat_pos['elevation_deg'] + pointing_offsets
+    results['pointing_error'] = pointing_error
+    results['in_beam'] = in_beam
+    
+    hidden = ~visible
+    if hidden.any():
+        for name in ('doppler_hz', 'path_loss_db', 'snr_db'):
+            results[name][hidden] = np.nan
+        results['antenna_az'][hidden] = 0
+        results['antenna_el'][hidden] = 0
+        results['pointing_error'][hidden] = 999
+        results['in_beam'][hidden] = False
     
     print(f"Simulation completed. Generated {len(results)} data points.")
     return results
@@ -250,7 +282,7 @@ def create_plots(results, config):
     Create matplotlib plots of simulation results.
     
     Args:
-        results: Simulation results list
+        results: Simulation results structured array
         config: Configuration dictionary
     """
     try:
@@ -264,14 +296,18 @@ def create_plots(results, config):
     os.makedirs('data/plots', exist_ok=True)
     
     # Extract data
-    times = [r['time_sec'] for r in results]
-    ranges = [r['satellite']['range_km'] for r in results]
-    elevations = [r['satellite']['elevation_deg'] for r in results]
-    azimuths = [r['satellite']['azimuth_deg'] for r in results]
-    dopplers = [r['signal']['doppler_hz'] for r in results if r['signal']['doppler_hz'] is not None]
-    snrs = [r['signal']['snr_db'] for r in results if r['signal']['snr_db'] is not None]
-    antenna_az = [r['antenna']['antenna_az_deg'] for r in results]
-    antenna_el = [r['antenna']['antenna_el_deg'] for r in results]
+    times = results['time_sec']
+    ranges = results['range_km']
+    elevations = results['elevation_deg']
+    azimuths = results['azimuth_deg']
+    # Gather the above-horizon rows (the ones with signal data) in one pass, then take column views
+    visible = results['elevation_deg'] >= 0
+    valid_rows = results[visible]
+    valid_times = valid_rows['time_sec']
+    dopplers = valid_rows['doppler_hz']
+    snrs = valid_rows['snr_db']
+    antenna_az = results['antenna_az']
+    antenna_el = results['antenna_el']
     
     # 1. Orbit plot (range vs time)
     plt.figure(figsize=(12, 8))
@@ -295,7 +331,6 @@ def create_plots(results, config):
     
     # 3. Signal metrics
     plt.subplot(2, 2, 3)
-    valid_times = [t for t, r in zip(times, results) if r['signal']['doppler_hz'] is not None]
     plt.plot(valid_times, dopplers, 'r-', linewidth=2, label='Doppler Shift')
     plt.xlabel('Time (seconds)')
     plt.ylabel('Doppler Shift (Hz)')
@@ -336,13 +371,14 @@ def print_summary(results, config):
     Print simulation summary.
     
     Args:
-        results: Simulation results list
+        results: Simulation results structured array
         config: Configuration dictionary
     """
     print("\n=== Simulation Summary ===")
     
-    # Count visible points
-    visible_points = sum(1 for r in results if r['satellite']['elevation_deg'] >= 0)
+    # Count visible points; the same horizon mask selects the signal samples
+    visible = results['elevation_deg'] >= 0
+    visible_points = int(visible.sum())
     total_points = len(results)
     
     print(f"Total simulation time: {config['duration_sec']} seconds")
@@ -350,19 +386,17 @@ def print_summary(results, config):
     
     if visible_points > 0:
         # Signal statistics
-        valid_signals = [r for r in results if r['signal']['snr_db'] is not None]
-        if valid_signals:
-            snrs = [r['signal']['snr_db'] for r in valid_signals]
-            dopplers = [r['signal']['doppler_hz'] for r in valid_signals]
-            
-            print(f"\nSignal Statistics:")
-            print(f"  Average SNR: {sum(snrs)/len(snrs):.1f} dB")
-            print(f"  SNR range: {min(snrs):.1f} to {max(snrs):.1f} dB")
-            print(f"  Average Doppler shift: {sum(dopplers)/len(dopplers):.1f} Hz")
-            print(f"  Doppler range: {min(dopplers):.1f} to {max(dopplers):.1f} Hz")
+        snrs = results['snr_db'][visible]
+        dopplers = results['doppler_hz'][visible]
+        
+        print(f"\nSignal Statistics:")
+        print(f"  Average SNR: {snrs.mean():.1f} dB")
+        print(f"  SNR range: {snrs.min():.1f} to {snrs.max():.1f} dB")
+        print(f"  Average Doppler shift: {dopplers.mean():.1f} Hz")
+        print(f"  Doppler range: {dopplers.min():.1f} to {dopplers.max():.1f} Hz")
         
         # Tracking statistics
-        in_beam_count = sum(1 for r in results if r['antenna']['in_beam'])
+        in_beam_count = int(np.count_nonzero(results['in_beam']))
         print(f"\nTracking Statistics:")
         print(f"  In beam: {in_beam_count}/{visible_points} points ({in_beam_count/visible_points*100:.1f}%)")
         print(f"  Beamwidth: {config['antenna']['beamwidth_deg']}°")
@@ -1,5 +1,5 @@
 """
-Enhanced Flask Dashboard for Dependency-free LEO Satellite Flyby Emulator
+Enhanced Flask Dashboard for the NumPy-only LEO Satellite Flyby Emulator demo
 - Displays comprehensive Matplotlib plots (orbit, signal, antenna tracking)
 - Real-time simulation data with interactive controls
 - Advanced visualizations with multiple plot types
@@ -7,226 +7,380 @@ Enhanced Flask Dashboard for Dependency-free LEO Satellite Flyby Emulator
 - Runs on localhost:5001 to avoid conflicts
 """
 import os
+import gzip
 import json
-import base64
 import math
 import random
+import threading
+import time
+from collections import namedtuple
 from io import BytesIO
-from datetime import datetime
-from flask import Flask, render_template, jsonify, request, Response
+from flask import Flask, render_template, jsonify, request, Response, abort
 import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import matplotlib.patches as patches
 import numpy as np
 
+# Optional fast JSON encoder; Flask's jsonify is used when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import simulation functions from demo.py
-from demo import CONFIG, run_simulation, calculate_satellite_position, calculate_doppler_shift, calculate_path_loss, calculate_snr, simulate_antenna_tracking
+from demo import CONFIG, run_simulation, calculate_satellite_position, calculate_doppler_shift, calculate_path_loss, calculate_snr
 
 app = Flask(__name__)
 
-# Global variable to store simulation results
-simulation_results = None
+# The configuration never changes at runtime, so its JSON body is encoded once
+_CONFIG_JSON = orjson.dumps(CONFIG) if orjson is not None else json.dumps(CONFIG)
+
+# Stored simulation and everything derived from it, built once per simulation:
+# - results: the structured record array
+# - columns: contiguous per-field arrays for plots and summaries
+# - last_visible_idx: index of the last above-horizon sample (None if never visible)
+# - status_cache: rounded status dict for every sample, so status requests are a list lookup
+# - sample_columns: per-field lists of native Python values, so real-time requests index
+#   without NumPy boxing
+# - version: the simulation version the bundle was built for
+SimulationState = namedtuple('SimulationState', [
+    'results', 'columns', 'last_visible_idx', 'status_cache', 'sample_columns', 'version'])
+
+# Current SimulationState (None until a simulation has run). It is replaced by one
+# assignment of a complete bundle, so handlers read this reference once per request and
+# never see results without their caches
+_simulation = None
+
+# Rendered plots keyed by (plot name, simulation version); cleared whenever results change
+_plot_cache = {}
+# Also used in ETags and plot URLs; seeded from the clock so versions (and thus browser
+# caches) from an earlier server process are never mistaken for the current simulation
+_sim_version = time.time_ns() // 1000000
+
+# Text responses at least this large are gzip-compressed for clients that accept it
+GZIP_MIN_BYTES = 500
+GZIP_MIMETYPES = ('text/html', 'application/json')
+
+# Line/scatter overlays are thinned to at most this many samples (histograms use every sample)
+MAX_PLOT_POINTS = 2000
+
+# Serialises simulation runs and rendering into the shared Matplotlib figure
+_render_lock = threading.RLock()
+_warmup_thread = None
+
+# Single Figure reused (cleared) for every plot instead of creating and closing one per image;
+# plot functions draw on it through the object-oriented Axes API, bypassing pyplot state
+_shared_fig = None
+
+# Per-thread PNG output buffer, rewound and overwritten rather than reallocated per image
+_img_buffer = threading.local()
 
 # Constants
 C = 299792458  # Speed of light in m/s
 
 
-def create_plot_image(plot_func, *args, **kwargs):
+def _json_response(payload):
+    """
+    Build a JSON response, encoded with orjson when available.
+    
+    Args:
+        payload: JSON-serialisable dict of plain Python values
+    
+    Returns:
+        Response: application/json response
+    """
+    if orjson is None:
+        return jsonify(payload)
+    return Response(orjson.dumps(payload), mimetype='application/json')
+
+
+def _conditional(response, etag):
     """
-    Create a matplotlib plot and return it as a base64 encoded image.
+    Tag a response and reduce it to 304 Not Modified if the client already has it.
     
     Args:
-        plot_func: Function that creates the plot
-        *args, **kwargs: Arguments for the plot function
+        response: Response to send
+        etag: Entity tag identifying the response content
     
     Returns:
-        str: Base64 encoded PNG image
+        Response: The tagged response, or an empty 304 response
+    """
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+
+def _set_simulation(results):
+    """
+    Store simulation results, publishing them with their derived caches in one assignment.
+    
+    Args:
+        results: Simulation results structured array, or None to clear
+    """
+    global _simulation, _sim_version
+    if results is None:
+        _simulation = None
+        _sim_version += 1
+        _plot_cache.clear()
+        return
+    
+    columns = {name: np.ascontiguousarray(results[name]) for name in results.dtype.names}
+    # Below-horizon samples carry a 999° sentinel; plots treat them as missing (NaN)
+    columns['pointing_error'][results['elevation_deg'] < 0] = np.nan
+    state = SimulationState(
+        results=results,
+        columns=columns,
+        last_visible_idx=_find_last_visible(results),
+        status_cache=tuple(_build_status(row) for row in results),
+        sample_columns={name: results[name].tolist() for name in results.dtype.names},
+        version=_sim_version + 1
+    )
+    _sim_version = state.version
+    _plot_cache.clear()
+    _simulation = state
+
+
+def _plot_stride(columns):
+    """Sampling stride that keeps plotted overlays at or below MAX_PLOT_POINTS."""
+    return max(1, -(-len(columns['time_sec']) // MAX_PLOT_POINTS))
+
+
+def _thin(columns, stride):
+    """Take every stride-th sample of each column (slices are views, not copies)."""
+    if stride == 1:
+        return columns
+    return {name: values[::stride] for name, values in columns.items()}
+
+
+def _find_last_visible(results):
+    """Return the index of the last sample with elevation >= 0, or None."""
+    valid_idx = np.flatnonzero(results['elevation_deg'] >= 0)
+    return int(valid_idx[-1]) if len(valid_idx) else None
+
+
+def create_plot_image(name, plot_func, *args, **kwargs):
     """
-    plt.figure(figsize=(12, 8))
-    plot_func(*args, **kwargs)
+    Create a matplotlib plot and return it as PNG bytes.
     
-    # Save plot to bytes buffer
-    img_buffer = BytesIO()
-    plt.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
-    img_buffer.seek(0)
+    Rendered images are cached per simulation version, so repeat requests
+    skip Matplotlib entirely.
     
-    # Encode to base64
-    img_data = base64.b64encode(img_buffer.getvalue()).decode()
-    plt.close()
+    Args:
+        name: Plot name used as the cache key
+        plot_func: Function that draws into the Figure passed as its first argument
+        *args, **kwargs: Further arguments for the plot function
     
+    Returns:
+        bytes: PNG image
+    """
+    global _shared_fig
+    key = (name, _sim_version)
+    cached = _plot_cache.get(key)
+    if cached is not None:
+        return cached
+    
+    with _render_lock:
+        if _shared_fig is None:
+            # Standalone Agg figure, outside pyplot's global figure registry
+            _shared_fig = Figure(figsize=(10, 6), dpi=100)
+            FigureCanvasAgg(_shared_fig)
+        else:
+            # Drop the previous plot's axes
+            _shared_fig.clear()
+        plot_func(_shared_fig, *args, **kwargs)
+        
+        # Save plot to bytes buffer (plot functions already call tight_layout, so no
+        # bbox_inches='tight' second pass; fast zlib level to keep rendering cheap)
+        img_buffer = getattr(_img_buffer, 'buf', None)
+        if img_buffer is None:
+            img_buffer = _img_buffer.buf = BytesIO()
+        # Overwrite from the start without truncating, so the allocation is kept; the PNG ends at tell()
+        img_buffer.seek(0)
+        _shared_fig.canvas.print_png(img_buffer, pil_kwargs={'compress_level': 1})
+    
+    # Copy out just this PNG; the buffer may still hold a longer tail from an earlier plot
+    with img_buffer.getbuffer() as view:
+        img_data = bytes(view[:img_buffer.tell()])
+    
+    _plot_cache[key] = img_data
     return img_data
 
 
-def plot_orbit_overview(results):
+def plot_orbit_overview(fig, results):
     """Create comprehensive orbit overview plot."""
-    times = [r['time_sec'] for r in results]
-    ranges = [r['satellite']['range_km'] for r in results]
-    elevations = [r['satellite']['elevation_deg'] for r in results]
-    azimuths = [r['satellite']['azimuth_deg'] for r in results]
-    
-    plt.subplot(2, 2, 1)
-    plt.plot(times, ranges, 'b-', linewidth=2)
-    plt.xlabel('Time (seconds)')
-    plt.ylabel('Range (km)')
-    plt.title('Satellite Range vs Time')
-    plt.grid(True, alpha=0.3)
-    
-    plt.subplot(2, 2, 2)
-    plt.plot(times, elevations, 'g-', linewidth=2)
-    plt.axhline(y=0, color='r', linestyle='--', alpha=0.5, label='Horizon')
-    plt.xlabel('Time (seconds)')
-    plt.ylabel('Elevation (degrees)')
-    plt.title('Satellite Elevation vs Time')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-    
-    plt.subplot(2, 2, 3)
-    plt.plot(times, azimuths, 'm-', linewidth=2)
-    plt.xlabel('Time (seconds)')
-    plt.ylabel('Azimuth (degrees)')
-    plt.title('Satellite Azimuth vs Time')
-    plt.grid(True, alpha=0.3)
-    
-    plt.subplot(2, 2, 4)
+    results = _thin(results, _plot_stride(results))
+    times = results['time_sec']
+    ranges = results['range_km']
+    elevations = results['elevation_deg']
+    azimuths = results['azimuth_deg']
+    
+    ax = fig.add_subplot(2, 2, 1)
+    ax.plot(times, ranges, 'b-', linewidth=2)
+    ax.set_xlabel('Time (seconds)')
+    ax.set_ylabel('Range (km)')
+    ax.set_title('Satellite Range vs Time')
+    ax.grid(True, alpha=0.3)
+    
+    ax = fig.add_subplot(2, 2, 2)
+    ax.plot(times, elevations, 'g-', linewidth=2)
+    ax.axhline(y=0, color='r', linestyle='--', alpha=0.5, label='Horizon')
+    ax.set_xlabel('Time (seconds)')
+    ax.set_ylabel('Elevation (degrees)')
+    ax.set_title('Satellite Elevation vs Time')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    
+    ax = fig.add_subplot(2, 2, 3)
+    ax.plot(times, azimuths, 'm-', linewidth=2)
+    ax.set_xlabel('Time (seconds)')
+    ax.set_ylabel('Azimuth (degrees)')
+    ax.set_title('Satellite Azimuth vs Time')
+    ax.grid(True, alpha=0.3)
+    
     # Create polar plot for ground track
-    ax = plt.subplot(2, 2, 4, projection='polar')
-    valid_data = [(az, el) for az, el in zip(azimuths, elevations) if el >= 0]
-    if valid_data:
-        az_vals, el_vals = zip(*valid_data)
-        ax.scatter(np.radians(az_vals), [90-el for el in el_vals], 
+    ax = fig.add_subplot(2, 2, 4, projection='polar')
+    above = elevations >= 0
+    if above.any():
+        el_vals = elevations[above]
+        ax.scatter(np.radians(azimuths[above]), 90 - el_vals, 
                   c=el_vals, cmap='viridis', s=20, alpha=0.7)
         ax.set_title('Ground Track (Polar View)')
         ax.grid(True)
     
-    plt.tight_layout()
+    fig.tight_layout()
 
 
-def plot_signal_metrics(results):
+def plot_signal_metrics(fig, results):
     """Create comprehensive signal metrics plot."""
-    times = [r['time_sec'] for r in results]
-    dopplers = [r['signal']['doppler_hz'] for r in results if r['signal']['doppler_hz'] is not None]
-    snrs = [r['signal']['snr_db'] for r in results if r['signal']['snr_db'] is not None]
-    path_losses = [r['signal']['path_loss_db'] for r in results if r['signal']['path_loss_db'] is not None]
-    valid_times = [t for t, r in zip(times, results) if r['signal']['doppler_hz'] is not None]
-    
-    plt.subplot(2, 2, 1)
-    plt.plot(valid_times, dopplers, 'r-', linewidth=2)
-    plt.xlabel('Time (seconds)')
-    plt.ylabel('Doppler Shift (Hz)')
-    plt.title('Doppler Shift vs Time')
-    plt.grid(True, alpha=0.3)
-    
-    plt.subplot(2, 2, 2)
-    plt.plot(valid_times, snrs, 'm-', linewidth=2)
-    plt.axhline(y=10, color='r', linestyle='--', alpha=0.5, label='10 dB threshold')
-    plt.axhline(y=15, color='orange', linestyle='--', alpha=0.5, label='15 dB threshold')
-    plt.xlabel('Time (seconds)')
-    plt.ylabel('SNR (dB)')
-    plt.title('Signal-to-Noise Ratio vs Time')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-    
-    plt.subplot(2, 2, 3)
-    plt.plot(valid_times, path_losses, 'b-', linewidth=2)
-    plt.xlabel('Time (seconds)')
-    plt.ylabel('Path Loss (dB)')
-    plt.title('Path Loss vs Time')
-    plt.grid(True, alpha=0.3)
-    
-    plt.subplot(2, 2, 4)
-    # SNR vs Range scatter plot
-    ranges = [r['satellite']['range_km'] for r in results if r['signal']['snr_db'] is not None]
-    plt.scatter(ranges, snrs, c=snrs, cmap='viridis', alpha=0.7, s=30)
-    plt.xlabel('Range (km)')
-    plt.ylabel('SNR (dB)')
-    plt.title('SNR vs Range')
-    plt.colorbar(label='SNR (dB)')
-    plt.grid(True, alpha=0.3)
+    results = _thin(results, _plot_stride(results))
+    valid = ~np.isnan(results['doppler_hz'])
+    valid_times = results['time_sec'][valid]
+    dopplers = results['doppler_hz'][valid]
+    snrs = results['snr_db'][valid]
+    path_losses = results['path_loss_db'][valid]
+    
+    ax = fig.add_subplot(2, 2, 1)
+    ax.plot(valid_times, dopplers, 'r-', linewidth=2)
+    ax.set_xlabel('Time (seconds)')
+    ax.set_ylabel('Doppler Shift (Hz)')
+    ax.set_title('Doppler Shift vs Time')
+    ax.grid(True, alpha=0.3)
+    
+    ax = fig.add_subplot(2, 2, 2)
+    ax.plot(valid_times, snrs, 'm-', linewidth=2)
+    ax.axhline(y=10, color='r', linestyle='--', alpha=0.5, label='10 dB threshold')
+    ax.axhline(y=15, color='orange', linestyle='--', alpha=0.5, label='15 dB threshold')
+    ax.set_xlabel('Time (seconds)')
+    ax.set_ylabel('SNR (dB)')
+    ax.set_title('Signal-to-Noise Ratio vs Time')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    
+    ax = fig.add_subplot(2, 2, 3)
+    ax.plot(valid_times, path_losses, 'b-', linewidth=2)
+    ax.set_xlabel('Time (seconds)')
+    ax.set_ylabel('Path Loss (dB)')
+    ax.set_title('Path Loss vs Time')
+    ax.grid(True, alpha=0.3)
     
-    plt.tight_layout()
+    # SNR vs Range scatter plot
+    ax = fig.add_subplot(2, 2, 4)
+    ranges = results['range_km'][valid]
+    scatter_plot = ax.scatter(ranges, snrs, c=snrs, cmap='viridis', alpha=0.7, s=30)
+    ax.set_xlabel('Range (km)')
+    ax.set_ylabel('SNR (dB)')
+    ax.set_title('SNR vs Range')
+    fig.colorbar(scatter_plot, ax=ax, label='SNR (dB)')
+    ax.grid(True, alpha=0.3)
+    
+    fig.tight_layout()
 
 
-def plot_antenna_tracking(results):
+def plot_antenna_tracking(fig, results):
     """Create comprehensive antenna tracking plot."""
-    azimuths = [r['satellite']['azimuth_deg'] for r in results]
-    elevations = [r['satellite']['elevation_deg'] for r in results]
-    antenna_az = [r['antenna']['antenna_az_deg'] for r in results]
-    antenna_el = [r['antenna']['antenna_el_deg'] for r in results]
-    pointing_errors = [r['antenna']['pointing_error_deg'] for r in results]
-    in_beam = [r['antenna']['in_beam'] for r in results]
-    
-    plt.subplot(2, 2, 1)
-    # Color points by lock status
-    locked_az = [az for az, lock in zip(azimuths, in_beam) if lock]
-    locked_el = [el for el, lock in zip(elevations, in_beam) if lock]
-    unlocked_az = [az for az, lock in zip(azimuths, in_beam) if not lock]
-    unlocked_el = [el for el, lock in zip(elevations, in_beam) if not lock]
-    
-    if locked_az:
-        plt.scatter(locked_az, locked_el, c='green', s=20, alpha=0.7, label='Locked')
-    if unlocked_az:
-        plt.scatter(unlocked_az, unlocked_el, c='red', s=20, alpha=0.7, label='Unlocked')
-    
-    plt.plot(antenna_az, antenna_el, 'b--', linewidth=2, alpha=0.7, label='Antenna Path')
-    plt.xlabel('Azimuth (degrees)')
-    plt.ylabel('Elevation (degrees)')
-    plt.title('Antenna Tracking vs Satellite Position')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-    
-    plt.subplot(2, 2, 2)
-    times = range(len(pointing_errors))
-    plt.plot(times, pointing_errors, 'g-', linewidth=2)
-    plt.axhline(y=CONFIG['antenna']['beamwidth_deg']/2, color='r', linestyle='--', 
-               alpha=0.5, label=f'Beamwidth/2 ({CONFIG["antenna"]["beamwidth_deg"]/2:.1f}°)')
-    plt.xlabel('Time Step')
-    plt.ylabel('Pointing Error (degrees)')
-    plt.title('Pointing Error vs Time')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-    
-    plt.subplot(2, 2, 3)
+    stride = _plot_stride(results)
+    overlay = _thin(results, stride)
+    azimuths = overlay['azimuth_deg']
+    elevations = overlay['elevation_deg']
+    antenna_az = overlay['antenna_az']
+    antenna_el = overlay['antenna_el']
+    pointing_errors = overlay['pointing_error']
+    in_beam = overlay['in_beam']
+    half_beam = CONFIG['antenna']['beamwidth_deg'] / 2
+    
+    ax = fig.add_subplot(2, 2, 1)
+    # Color points by lock status (one boolean mask split instead of four list scans)
+    unlocked = ~in_beam
+    
+    if in_beam.any():
+        ax.scatter(azimuths[in_beam], elevations[in_beam], c='green', s=20, alpha=0.7, label='Locked')
+    if unlocked.any():
+        ax.scatter(azimuths[unlocked], elevations[unlocked], c='red', s=20, alpha=0.7, label='Unlocked')
+    
+    ax.plot(antenna_az, antenna_el, 'b--', linewidth=2, alpha=0.7, label='Antenna Path')
+    ax.set_xlabel('Azimuth (degrees)')
+    ax.set_ylabel('Elevation (degrees)')
+    ax.set_title('Antenna Tracking vs Satellite Position')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    
+    ax = fig.add_subplot(2, 2, 2)
+    times = np.arange(0, len(results['pointing_error']), stride)
+    ax.plot(times, pointing_errors, 'g-', linewidth=2)
+    ax.axhline(y=half_beam, color='r', linestyle='--', 
+               alpha=0.5, label=f'Beamwidth/2 ({half_beam:.1f}°)')
+    ax.set_xlabel('Time Step')
+    ax.set_ylabel('Pointing Error (degrees)')
+    ax.set_title('Pointing Error vs Time')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    
+    ax = fig.add_subplot(2, 2, 3)
     # Lock status over time
-    lock_status = [1 if lock else 0 for lock in in_beam]
-    plt.plot(times, lock_status, 'b-', linewidth=2)
-    plt.xlabel('Time Step')
-    plt.ylabel('Lock Status')
-    plt.title('Antenna Lock Status Over Time')
-    plt.yticks([0, 1], ['Unlocked', 'Locked'])
-    plt.grid(True, alpha=0.3)
-    
-    plt.subplot(2, 2, 4)
+    lock_status = in_beam.astype(np.int8)
+    ax.plot(times, lock_status, 'b-', linewidth=2)
+    ax.set_xlabel('Time Step')
+    ax.set_ylabel('Lock Status')
+    ax.set_title('Antenna Lock Status Over Time')
+    ax.set_yticks([0, 1], ['Unlocked', 'Locked'])
+    ax.grid(True, alpha=0.3)
+    
+    ax = fig.add_subplot(2, 2, 4)
     # Pointing error histogram
-    valid_errors = [err for err in pointing_errors if err < 999]
-    if valid_errors:
-        plt.hist(valid_errors, bins=20, alpha=0.7, color='green', edgecolor='black')
-        plt.axvline(x=CONFIG['antenna']['beamwidth_deg']/2, color='r', linestyle='--',
-                    alpha=0.5, label=f'Beamwidth/2 ({CONFIG["antenna"]["beamwidth_deg"]/2:.1f}°)')
-        plt.xlabel('Pointing Error (degrees)')
-        plt.ylabel('Frequency')
-        plt.title('Pointing Error Distribution')
-        plt.legend()
-        plt.grid(True, alpha=0.3)
-    
-    plt.tight_layout()
+    all_errors = results['pointing_error']
+    valid_errors = all_errors[np.isfinite(all_errors)]
+    if valid_errors.size:
+        ax.hist(valid_errors, bins=20, alpha=0.7, color='green', edgecolor='black')
+        ax.axvline(x=half_beam, color='r', linestyle='--',
+                   alpha=0.5, label=f'Beamwidth/2 ({half_beam:.1f}°)')
+        ax.set_xlabel('Pointing Error (degrees)')
+        ax.set_ylabel('Frequency')
+        ax.set_title('Pointing Error Distribution')
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+    
+    fig.tight_layout()
 
 
-def plot_3d_trajectory(results):
+def plot_3d_trajectory(fig, results):
     """Create 3D trajectory visualization."""
     from mpl_toolkits.mplot3d import Axes3D
     
     # Extract data
-    ranges = [r['satellite']['range_km'] for r in results]
-    azimuths = [r['satellite']['azimuth_deg'] for r in results]
-    elevations = [r['satellite']['elevation_deg'] for r in results]
+    results = _thin(results, _plot_stride(results))
+    ranges = results['range_km']
+    azimuths = results['azimuth_deg']
+    elevations = results['elevation_deg']
+    
+    # Convert to 3D coordinates (horizontal range computed once, shared by x and y)
+    az_rad = np.deg2rad(azimuths)
+    el_rad = np.deg2rad(elevations)
+    horizontal = ranges * np.cos(el_rad)
+    x = horizontal * np.cos(az_rad)
+    y = horizontal * np.sin(az_rad)
+    z = ranges * np.sin(el_rad)
     
-    # Convert to 3D coordinates
-    x = [r * math.cos(math.radians(az)) * math.cos(math.radians(el)) for r, az, el in zip(ranges, azimuths, elevations)]
-    y = [r * math.sin(math.radians(az)) * math.cos(math.radians(el)) for r, az, el in zip(ranges, azimuths, elevations)]
-    z = [r * math.sin(math.radians(el)) for r, el in zip(ranges, elevations)]
-    
-    fig = plt.figure(figsize=(10, 8))
     ax = fig.add_subplot(111, projection='3d')
     
     # Plot trajectory
@@ -244,40 +398,83 @@ def plot_3d_trajectory(results):
     ax.set_title('3D Satellite Trajectory')
     
     # Add colorbar
-    cbar = plt.colorbar(scatter_plot, ax=ax, shrink=0.8, aspect=20)
+    cbar = fig.colorbar(scatter_plot, ax=ax, shrink=0.8, aspect=20)
     cbar.set_label('Elevation (degrees)')
     
     ax.legend()
-    plt.tight_layout()
+    fig.tight_layout()
 
 
-def plot_signal_spectrum(results):
+def plot_signal_spectrum(fig, results):
     """Create signal spectrum analysis."""
     # Extract Doppler shifts
-    dopplers = [r['signal']['doppler_hz'] for r in results if r['signal']['doppler_hz'] is not None]
-    snrs = [r['signal']['snr_db'] for r in results if r['signal']['snr_db'] is not None]
+    valid = ~np.isnan(results['doppler_hz'])
+    dopplers = results['doppler_hz'][valid]
+    snrs = results['snr_db'][valid]
     
-    if not dopplers:
-        plt.text(0.5, 0.5, 'No signal data available', ha='center', va='center', transform=plt.gca().transAxes)
+    if not valid.any():
+        ax = fig.add_subplot()
+        ax.text(0.5, 0.5, 'No signal data available', ha='center', va='center', transform=ax.transAxes)
         return
     
-    plt.subplot(2, 1, 1)
-    plt.hist(dopplers, bins=30, alpha=0.7, color='blue', edgecolor='black')
-    plt.xlabel('Doppler Shift (Hz)')
-    plt.ylabel('Frequency')
-    plt.title('Doppler Shift Distribution')
-    plt.grid(True, alpha=0.3)
+    ax = fig.add_subplot(2, 1, 1)
+    ax.hist(dopplers, bins=30, alpha=0.7, color='blue', edgecolor='black')
+    ax.set_xlabel('Doppler Shift (Hz)')
+    ax.set_ylabel('Frequency')
+    ax.set_title('Doppler Shift Distribution')
+    ax.grid(True, alpha=0.3)
+    
+    ax = fig.add_subplot(2, 1, 2)
+    ax.hist(snrs, bins=30, alpha=0.7, color='green', edgecolor='black')
+    ax.axvline(x=10, color='r', linestyle='--', alpha=0.5, label='10 dB threshold')
+    ax.set_xlabel('SNR (dB)')
+    ax.set_ylabel('Frequency')
+    ax.set_title('SNR Distribution')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    
+    fig.tight_layout()
+
+
+# Dashboard plots served from /plot/<name>, in page order
+PLOT_FUNCS = {
+    'orbit': plot_orbit_overview,
+    'signal': plot_signal_metrics,
+    'tracking': plot_antenna_tracking,
+    '3d': plot_3d_trajectory,
+    'spectrum': plot_signal_spectrum
+}
+
+# Expensive plots left out of the ?plots=basic page
+HEAVY_PLOTS = ('3d', 'spectrum')
+
+
+def _round_or_none(value, ndigits=None):
+    """Convert (and optionally round) a float for JSON output, mapping NaN (no signal) to None."""
+    if math.isnan(value):
+        return None
+    return float(value) if ndigits is None else round(float(value), ndigits)
+
+
+def _time_index(current_time_sec, n_samples, rounding=round, nan_index=0):
+    """
+    Index of the sample for a requested time on the uniform time grid (samples from t=0).
     
-    plt.subplot(2, 1, 2)
-    plt.hist(snrs, bins=30, alpha=0.7, color='green', edgecolor='black')
-    plt.axvline(x=10, color='r', linestyle='--', alpha=0.5, label='10 dB threshold')
-    plt.xlabel('SNR (dB)')
-    plt.ylabel('Frequency')
-    plt.title('SNR Distribution')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
+    Args:
+        current_time_sec: Requested time in seconds; may be ±inf or NaN
+        n_samples: Number of samples
+        rounding: round for the nearest sample, math.ceil for the first sample at or after it
+        nan_index: Index returned for a NaN time (negative counts from the end)
     
-    plt.tight_layout()
+    Returns:
+        int: Sample index in [0, n_samples - 1]; ±inf clamps to the last/first sample
+    """
+    if math.isnan(current_time_sec):
+        return nan_index % n_samples
+    if math.isinf(current_time_sec):
+        return n_samples - 1 if current_time_sec > 0 else 0
+    idx = int(rounding(current_time_sec / CONFIG['time_step_sec']))
+    return min(max(idx, 0), n_samples - 1)
 
 
 def get_current_status(results, current_time_sec=None):
@@ -285,129 +482,214 @@ def get_current_status(results, current_time_sec=None):
     Get current simulation status for a given time.
     
     Args:
-        results: Simulation results
+        results: Simulation results structured array, or a SimulationState whose
+                 precomputed caches are used
         current_time_sec: Current time in seconds (default: latest)
     
     Returns:
         dict: Current status data
     """
-    if not results:
+    state = results if isinstance(results, SimulationState) else None
+    if state is not None:
+        results = state.results
+    if results is None or len(results) == 0:
         return None
     
     if current_time_sec is None:
-        # Get latest valid result
-        valid_results = [r for r in results if r['satellite']['elevation_deg'] >= 0]
-        if not valid_results:
+        # Get latest valid result (precomputed for the stored simulation)
+        idx = state.last_visible_idx if state is not None else _find_last_visible(results)
+        if idx is None:
             return None
-        current_result = valid_results[-1]
     else:
-        # Find result closest to current time
-        current_result = min(results, key=lambda x: abs(x['time_sec'] - current_time_sec))
+        # Samples are uniformly spaced from t=0, so the closest one is found by arithmetic
+        idx = _time_index(current_time_sec, len(results))
+    
+    if state is not None:
+        return state.status_cache[idx]
+    return _build_status(results[idx])
+
+
+def _build_status(current_result):
+    """
+    Format one simulation sample as a status dict with display rounding.
+    
+    Args:
+        current_result: One RESULT_DTYPE record
     
+    Returns:
+        dict: Status data (treat as read-only; instances are cached and shared)
+    """
     return {
-        'time_sec': current_result['time_sec'],
+        'time_sec': float(current_result['time_sec']),
         'satellite': {
-            'azimuth_deg': round(current_result['satellite']['azimuth_deg'], 2),
-            'elevation_deg': round(current_result['satellite']['elevation_deg'], 2),
-            'range_km': round(current_result['satellite']['range_km'], 1),
-            'altitude_km': current_result['satellite']['altitude_km']
+            'azimuth_deg': round(float(current_result['azimuth_deg']), 2),
+            'elevation_deg': round(float(current_result['elevation_deg']), 2),
+            'range_km': round(float(current_result['range_km']), 1),
+            'altitude_km': CONFIG['satellite']['altitude_km']
         },
         'signal': {
-            'doppler_hz': round(current_result['signal']['doppler_hz'], 1) if current_result['signal']['doppler_hz'] else None,
-            'snr_db': round(current_result['signal']['snr_db'], 1) if current_result['signal']['snr_db'] else None,
-            'path_loss_db': round(current_result['signal']['path_loss_db'], 1) if current_result['signal']['path_loss_db'] else None
+            'doppler_hz': _round_or_none(current_result['doppler_hz'], 1),
+            'snr_db': _round_or_none(current_result['snr_db'], 1),
+            'path_loss_db': _round_or_none(current_result['path_loss_db'], 1)
         },
         'antenna': {
-            'azimuth_deg': round(current_result['antenna']['antenna_az_deg'], 2),
-            'elevation_deg': round(current_result['antenna']['antenna_el_deg'], 2),
-            'pointing_error_deg': round(current_result['antenna']['pointing_error_deg'], 2),
-            'in_beam': current_result['antenna']['in_beam']
+            'azimuth_deg': round(float(current_result['antenna_az']), 2),
+            'elevation_deg': round(float(current_result['antenna_el']), 2),
+            'pointing_error_deg': round(float(current_result['pointing_error']), 2),
+            'in_beam': bool(current_result['in_beam'])
         }
     }
 
 
+def _ensure_simulation():
+    """Run the simulation if not already done (call with _render_lock held)."""
+    if _simulation is None:
+        print("Running simulation...")
+        _set_simulation(run_simulation(CONFIG))
+
+
+def get_plot_png(name):
+    """
+    Return a dashboard plot as PNG bytes, rendering it on first use.
+    
+    Args:
+        name: Plot name (a key of PLOT_FUNCS)
+    
+    Returns:
+        tuple: (PNG bytes, simulation version the plot was rendered from)
+    """
+    with _render_lock:
+        _ensure_simulation()
+        state = _simulation
+        return create_plot_image(name, PLOT_FUNCS[name], state.columns), state.version
+
+
+def _warmup():
+    """Pre-render every plot in the background, taking the render lock one plot at a time."""
+    for name in PLOT_FUNCS:
+        try:
+            get_plot_png(name)
+        except ImportError:
+            # 3D plotting not available
+            pass
+
+
+def start_warmup():
+    """Start the simulation and plot rendering on a background thread."""
+    global _warmup_thread
+    _warmup_thread = threading.Thread(target=_warmup, daemon=True)
+    _warmup_thread.start()
+
+
 @app.route('/')
 def index():
-    """Main dashboard page."""
-    global simulation_results
+    """Main dashboard page (?plots=basic skips the 3D trajectory and spectrum plots)."""
+    basic = request.args.get('plots', 'all') == 'basic'
     
-    # Run simulation if not already done
-    if simulation_results is None:
-        print("Running simulation...")
-        simulation_results = run_simulation(CONFIG)
+    with _render_lock:
+        _ensure_simulation()
+        state = _simulation
+    sim_version = state.version
+    
+    # The page only changes with the simulation, so a matching ETag skips rendering entirely
+    etag = f'page-{sim_version}-{"basic" if basic else "all"}'
+    if request.if_none_match.contains(etag):
+        return _conditional(Response(), etag)
     
     # Get current status
-    current_status = get_current_status(simulation_results)
+    current_status = get_current_status(state)
     
-    # Create all plots
-    orbit_plot = create_plot_image(plot_orbit_overview, simulation_results)
-    signal_plot = create_plot_image(plot_signal_metrics, simulation_results)
-    tracking_plot = create_plot_image(plot_antenna_tracking, simulation_results)
+    # Plots are fetched by the browser from /plot/<name>, in parallel and cacheable
+    plots = [name for name in PLOT_FUNCS if not (basic and name in HEAVY_PLOTS)]
     
-    # Create additional plots
+    html = render_template('demo_dashboard.html',
+                         current_status=current_status,
+                         config=CONFIG,
+                         sim_version=sim_version,
+                         plots=plots)
+    return _conditional(Response(html, mimetype='text/html'), etag)
+
+
+@app.route('/plot/<name>')
+def plot_image(name):
+    """Serve one dashboard plot as a PNG with an ETag keyed on the simulation version."""
+    if name not in PLOT_FUNCS:
+        abort(404)
     try:
-        trajectory_3d_plot = create_plot_image(plot_3d_trajectory, simulation_results)
-        spectrum_plot = create_plot_image(plot_signal_spectrum, simulation_results)
+        png, sim_version = get_plot_png(name)
     except ImportError:
-        # Fallback if 3D plotting not available
-        trajectory_3d_plot = None
-        spectrum_plot = create_plot_image(plot_signal_spectrum, simulation_results)
-    
-    return render_template('demo_dashboard.html',
-                         orbit_plot=orbit_plot,
-                         signal_plot=signal_plot,
-                         tracking_plot=tracking_plot,
-                         trajectory_3d_plot=trajectory_3d_plot,
-                         spectrum_plot=spectrum_plot,
-                         current_status=current_status,
-                         config=CONFIG)
+        # 3D plotting not available
+        abort(404)
+    
+    response = Response(png, mimetype='image/png')
+    response.set_etag(f'{sim_version}-{name}')
+    response.cache_control.max_age = 3600
+    return response.make_conditional(request)
+
+
+@app.after_request
+def _gzip_response(response):
+    """Gzip HTML/JSON bodies (level 1: most of the saving for almost no CPU)."""
+    if (response.status_code != 200 or response.direct_passthrough or
+            response.mimetype not in GZIP_MIMETYPES or
+            'Content-Encoding' in response.headers or
+            'gzip' not in request.headers.get('Accept-Encoding', '')):
+        return response
+    data = response.get_data()
+    if len(data) < GZIP_MIN_BYTES:
+        return response
+    response.set_data(gzip.compress(data, compresslevel=1))
+    response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    return response
 
 
 @app.route('/api/status')
 def api_status():
     """API endpoint to get current simulation status."""
-    global simulation_results
-    
-    if simulation_results is None:
-        return jsonify({'error': 'Simulation not run'})
+    state = _simulation
+    if state is None:
+        return _json_response({'error': 'Simulation not run'})
     
     current_time = request.args.get('time', type=float)
-    status = get_current_status(simulation_results, current_time)
+    status = get_current_status(state, current_time)
     
     if status is None:
-        return jsonify({'error': 'No valid data for requested time'})
+        return _json_response({'error': 'No valid data for requested time'})
     
-    return jsonify(status)
+    # Pollers asking for the same sample of the same simulation get an empty 304
+    return _conditional(_json_response(status), f'status-{state.version}-{status["time_sec"]}')
 
 
 @app.route('/api/config')
 def api_config():
     """API endpoint to get current configuration."""
-    return jsonify(CONFIG)
+    return _conditional(Response(_CONFIG_JSON, mimetype='application/json'), f'config-{_sim_version}')
 
 
 @app.route('/api/restart')
 def api_restart():
     """API endpoint to restart simulation."""
-    global simulation_results
-    simulation_results = None
-    return jsonify({'message': 'Simulation restarted'})
+    with _render_lock:
+        _set_simulation(None)
+    start_warmup()
+    return _json_response({'message': 'Simulation restarted'})
 
 
 @app.route('/api/summary')
 def api_summary():
     """API endpoint to get simulation summary."""
-    global simulation_results
-    
-    if simulation_results is None:
-        return jsonify({'error': 'Simulation not run'})
+    state = _simulation
+    if state is None:
+        return _json_response({'error': 'Simulation not run'})
+    columns = state.columns
     
-    # Calculate summary statistics
-    visible_points = sum(1 for r in simulation_results if r['satellite']['elevation_deg'] >= 0)
-    total_points = len(simulation_results)
+    # Calculate summary statistics (one C-level reduction per cached column)
+    visible_points = int(np.count_nonzero(columns['elevation_deg'] >= 0))
+    total_points = len(columns['time_sec'])
     
-    valid_signals = [r for r in simulation_results if r['signal']['snr_db'] is not None]
-    in_beam_count = sum(1 for r in simulation_results if r['antenna']['in_beam'])
+    valid = ~np.isnan(columns['snr_db'])
+    in_beam_count = int(np.count_nonzero(columns['in_beam']))
     
     summary = {
         'total_time_sec': CONFIG['duration_sec'],
@@ -418,58 +700,68 @@ def api_summary():
         'tracking_accuracy_percent': round(in_beam_count / visible_points * 100, 1) if visible_points > 0 else 0
     }
     
-    if valid_signals:
-        snrs = [r['signal']['snr_db'] for r in valid_signals]
-        dopplers = [r['signal']['doppler_hz'] for r in valid_signals]
+    if valid.any():
+        snrs = columns['snr_db'][valid]
+        dopplers = columns['doppler_hz'][valid]
         
         summary.update({
-            'avg_snr_db': round(sum(snrs) / len(snrs), 1),
-            'min_snr_db': round(min(snrs), 1),
-            'max_snr_db': round(max(snrs), 1),
-            'avg_doppler_hz': round(sum(dopplers) / len(dopplers), 1),
-            'min_doppler_hz': round(min(dopplers), 1),
-            'max_doppler_hz': round(max(dopplers), 1)
+            'avg_snr_db': round(float(snrs.mean()), 1),
+            'min_snr_db': round(float(snrs.min()), 1),
+            'max_snr_db': round(float(snrs.max()), 1),
+            'avg_doppler_hz': round(float(dopplers.mean()), 1),
+            'min_doppler_hz': round(float(dopplers.min()), 1),
+            'max_doppler_hz': round(float(dopplers.max()), 1)
         })
     
-    return jsonify(summary)
+    return _conditional(_json_response(summary), f'summary-{state.version}')
 
 
 @app.route('/api/real_time')
 def api_real_time():
     """Real-time data streaming endpoint."""
-    global simulation_results
-    
-    if simulation_results is None:
-        return jsonify({'error': 'Simulation not run'})
+    state = _simulation
+    if state is None:
+        return _json_response({'error': 'Simulation not run'})
+    columns = state.sample_columns
     
     # Get current time from request
     current_time = request.args.get('time', type=float)
     if current_time is None:
         current_time = 0
     
-    # Find data for current time
-    current_data = None
-    for result in simulation_results:
-        if result['time_sec'] >= current_time:
-            current_data = result
-            break
-    
-    if current_data is None:
-        current_data = simulation_results[-1]
-    
-    return jsonify({
-        'time_sec': current_data['time_sec'],
-        'satellite': current_data['satellite'],
-        'signal': current_data['signal'],
-        'antenna': current_data['antenna']
+    # Find data for current time (first sample at or after it, by index arithmetic on the
+    # uniform time grid); a NaN time matches no sample and falls back to the last one
+    i = _time_index(current_time, len(columns['time_sec']), rounding=math.ceil, nan_index=-1)
+    
+    return _json_response({
+        'time_sec': columns['time_sec'][i],
+        'satellite': {
+            'latitude_deg': columns['latitude_deg'][i],
+            'longitude_deg': columns['longitude_deg'][i],
+            'range_km': columns['range_km'][i],
+            'azimuth_deg': columns['azimuth_deg'][i],
+            'elevation_deg': columns['elevation_deg'][i],
+            'altitude_km': CONFIG['satellite']['altitude_km']
+        },
+        'signal': {
+            'doppler_hz': _round_or_none(columns['doppler_hz'][i]),
+            'path_loss_db': _round_or_none(columns['path_loss_db'][i]),
+            'snr_db': _round_or_none(columns['snr_db'][i])
+        },
+        'antenna': {
+            'antenna_az_deg': columns['antenna_az'][i],
+            'antenna_el_deg': columns['antenna_el'][i],
+            'pointing_error_deg': columns['pointing_error'][i],
+            'in_beam': columns['in_beam'][i]
+        }
     })
 
 
 # Create templates directory and HTML template
 def create_html_template():
-    """Create the enhanced HTML template for the dashboard."""
-    template_dir = 'demo/templates'
-    os.makedirs(template_dir, exist_ok=True)
+    """Create the enhanced HTML template for the dashboard (skipped if already up to date)."""
+    template_dir = os.path.join(app.root_path, app.template_folder)
+    template_path = os.path.join(template_dir, 'demo_dashboard.html')
     
     html_content = '''<!DOCTYPE html>
 <html lang="en">
@@ -768,30 +1060,32 @@ def create_html_template():
         <div class="plots-section">
             <div class="plot-container">
                 <h2>🛰️ Orbit Overview</h2>
-                <img src="data:image/png;base64,{{ orbit_plot }}" alt="Orbit Overview">
+                <img src="/plot/orbit?v={{ sim_version }}" alt="Orbit Overview">
             </div>
             
             <div class="plot-container">
                 <h2>📡 Signal Metrics</h2>
-                <img src="data:image/png;base64,{{ signal_plot }}" alt="Signal Metrics">
+                <img src="/plot/signal?v={{ sim_version }}" alt="Signal Metrics">
             </div>
             
             <div class="plot-container">
                 <h2>🎯 Antenna Tracking</h2>
-                <img src="data:image/png;base64,{{ tracking_plot }}" alt="Antenna Tracking">
+                <img src="/plot/tracking?v={{ sim_version }}" alt="Antenna Tracking">
             </div>
             
-            {% if trajectory_3d_plot %}
+            {% if '3d' in plots %}
             <div class="plot-container">
                 <h2>🌍 3D Trajectory</h2>
-                <img src="data:image/png;base64,{{ trajectory_3d_plot }}" alt="3D Trajectory">
+                <img src="/plot/3d?v={{ sim_version }}" alt="3D Trajectory">
             </div>
             {% endif %}
             
+            {% if 'spectrum' in plots %}
             <div class="plot-container">
                 <h2>📊 Signal Spectrum</h2>
-                <img src="data:image/png;base64,{{ spectrum_plot }}" alt="Signal Spectrum">
+                <img src="/plot/spectrum?v={{ sim_version }}" alt="Signal Spectrum">
             </div>
+            {% endif %}
         </div>
         
         <div class="summary">
@@ -891,7 +1185,16 @@ def create_html_template():
 </body>
 </html>'''
     
-    with open(f'{template_dir}/demo_dashboard.html', 'w', encoding='utf-8', errors='ignore') as f:
+    # Only write when the file is missing or stale, so normal startups do no file writes
+    try:
+        with open(template_path, 'r', encoding='utf-8') as f:
+            if f.read() == html_content:
+                return
+    except OSError:
+        pass
+    
+    os.makedirs(template_dir, exist_ok=True)
+    with open(template_path, 'w', encoding='utf-8', errors='ignore') as f:
         f.write(html_content)
 
 
@@ -903,6 +1206,9 @@ def main():
     # Create HTML template
     create_html_template()
     
+    # Simulate and pre-render the plots while the server starts up
+    start_warmup()
+    
     print("🚀 Starting enhanced Flask demo dashboard...")
     print("📊 Dashboard will be available at: http://localhost:5001")
     print("🎯 Features:")
@@ -1,14 +1,17 @@
 """
 LEO Satellite Flyby Simulator
-- Computes azimuth, elevation, range, and radial velocity relative to a ground station.
+- Computes azimuth, elevation, range, and radial velocity (positive when approaching)
+  relative to a ground station.
 - Reads TLE from data/tle_example.txt and config from config/sim_config.yaml.
 - Outputs results as a pandas DataFrame and logs to data/logs/orbit_log.csv.
 """
 import os
 import sys
+import functools
 import yaml
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime
 import numpy as np # Added for velocity calculation
 
 try:
@@ -16,19 +19,54 @@ try:
 except ImportError:
     raise ImportError("Skyfield is required. Install with: pip install skyfield")
 
+# Prefer the LibYAML-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 # Constants
 TLE_PATH = 'data/tle_example.txt'
 CONFIG_PATH = 'config/sim_config.yaml'
 LOG_PATH = 'data/logs/orbit_log.csv'
+CSV_FLOAT_FORMAT = '%.6g'  # 6 significant digits keeps the log compact
+CSV_CHUNK_ROWS = 65536     # rows formatted per write, bounds the CSV text buffer
+
+# Skyfield objects reused across simulate_flyby calls
+_TS = None              # shared timescale (loading it parses leap-second/ΔT tables)
+_TOPOS_CACHE = {}       # (lat, lon, alt) -> wgs84 ground station position
+
+# One record per sample; angles as float32 (sub-degree model accuracy), range/velocity float64
+ORBIT_DTYPE = np.dtype([
+    ('time', 'datetime64[s]'),
+    ('azimuth', 'f4'),
+    ('elevation', 'f4'),
+    ('range', 'f8'),
+    ('velocity', 'f8'),
+    ('below_horizon', '?'),
+])
+
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml_cached(path, mtime_ns, size):
+    """Parse a YAML file once per (path, mtime, size); edits to the file invalidate it."""
+    with open(path, 'rb') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def _load_yaml(path):
+    """Load a YAML file, reusing the parsed result while the file is unchanged."""
+    st = os.stat(path)
+    return _load_yaml_cached(os.path.abspath(path), st.st_mtime_ns, st.st_size)
 
 
 def load_config(config_path):
     """Load simulation and ground station config from YAML."""
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
-        gs = config['ground_station']
-        sim = config.get('simulation', {})
+        config = _load_yaml(config_path)
+        # Copies, so callers cannot modify the cached config
+        gs = dict(config['ground_station'])
+        sim = dict(config.get('simulation', {}))
         return gs, sim
     except Exception as e:
         raise RuntimeError(f"Failed to load config: {e}")
@@ -46,12 +84,27 @@ def load_tle(tle_path):
         raise RuntimeError(f"Failed to load TLE: {e}")
 
 
-def simulate_flyby(gs, sim, tle_lines):
+def _get_timescale():
+    """Return the shared Skyfield timescale, loading it on first use."""
+    global _TS
+    if _TS is None:
+        _TS = load.timescale()
+    return _TS
+
+
+@functools.lru_cache(maxsize=1024)
+def _make_satellite(name, line1, line2):
+    """Parse a TLE into an EarthSatellite (SGP4 record), once per distinct TLE."""
+    return EarthSatellite(line1, line2, name, _get_timescale())
+
+
+def simulate_flyby_records(gs, sim, tle_lines, start_time=None):
     """
-    Simulate satellite flyby and return a pandas DataFrame.
+    Simulate satellite flyby and return a structured NumPy array of ORBIT_DTYPE.
     gs: ground station dict
     sim: simulation params dict
     tle_lines: (name, line1, line2)
+    start_time: optional UTC datetime of the first sample (default: now)
     """
     # Parse ground station coordinates
     try:
@@ -65,53 +118,102 @@ def simulate_flyby(gs, sim, tle_lines):
     duration = int(sim.get('duration_sec', 600))  # default 10 min
     time_step = int(sim.get('time_step_sec', 1))  # default 1 sec
 
-    # Load TLE and create satellite object
+    ts = _get_timescale()
+
+    # Load TLE and create satellite object (parsed once per TLE)
     try:
-        satellite = EarthSatellite(tle_lines[1], tle_lines[2], tle_lines[0])
+        satellite = _make_satellite(tle_lines[0], tle_lines[1], tle_lines[2])
     except Exception as e:
         raise ValueError(f"Invalid TLE: {e}")
 
-    ts = load.timescale()
-    # Start time: now (UTC)
-    t0 = datetime.utcnow()
-    times = [t0 + timedelta(seconds=i) for i in range(0, duration + 1, time_step)]
+    # Start time: now (UTC) unless given, truncated to whole seconds
+    t0 = (start_time or datetime.utcnow()).replace(microsecond=0)
+    seconds = np.arange(0, duration + 1, time_step)
+    times64 = np.datetime64(t0, 's') + seconds.astype('timedelta64[s]')
+    
+    # One vector Skyfield time; array-valued seconds roll over into minutes/hours/days
+    sf_times = ts.utc(t0.year, t0.month, t0.day, t0.hour, t0.minute, t0.second + seconds)
+
+    # Ground station location (corrected API usage), built once per position
+    gs_topos = _TOPOS_CACHE.get((lat, lon, alt))
+    if gs_topos is None:
+        gs_topos = _TOPOS_CACHE[(lat, lon, alt)] = wgs84.latlon(lat, lon, elevation_m=alt)
+
+    # Satellite position relative to ground station, propagated for all times at once
+    topocentric = (satellite - gs_topos).at(sf_times)
+    el, az, distance = topocentric.altaz()
+    
+    # Radial velocity: relative velocity projected onto the line of sight, (r·v)/|r|.
+    # Sign is flipped so approaching is positive, the convention signal_model uses for Doppler
+    position_km = topocentric.position.km
+    velocity = -np.einsum('ij,ij->j', position_km, topocentric.velocity.km_per_s) / distance.km
+    
+    records = np.empty(len(seconds), dtype=ORBIT_DTYPE)
+    records['time'] = times64
+    records['azimuth'] = az.degrees
+    records['elevation'] = el.degrees
+    records['range'] = distance.km
+    records['velocity'] = velocity
+    records['below_horizon'] = records['elevation'] < 0  # Flag if below horizon
+    return records
+
+
+def records_to_dataframe(records):
+    """
+    Convert ORBIT_DTYPE records to the orbit DataFrame, with 'YYYY-MM-DD HH:MM:SS' times.
+    """
+    columns = {name: records[name] for name in ORBIT_DTYPE.names}
+    columns['time'] = np.char.replace(np.datetime_as_string(records['time']), 'T', ' ')
+    return pd.DataFrame(columns)
+
+
+def simulate_flyby(gs, sim, tle_lines, start_time=None):
+    """
+    Simulate satellite flyby and return a pandas DataFrame.
+    gs: ground station dict
+    sim: simulation params dict
+    tle_lines: (name, line1, line2)
+    start_time: optional UTC datetime of the first sample (default: now)
+    """
+    return records_to_dataframe(simulate_flyby_records(gs, sim, tle_lines, start_time))
+
+
+def _simulate_one(args):
+    """Worker entry point for simulate_flybys (must be picklable)."""
+    return simulate_flyby_records(*args)
+
+
+def simulate_flybys(gs, sim, tle_list, max_workers=None):
+    """
+    Simulate flybys of several satellites over the same time grid, one process per CPU.
+    gs: ground station dict
+    sim: simulation params dict
+    tle_list: sequence of (name, line1, line2)
+    max_workers: number of worker processes (default: os.cpu_count())
+    Returns a list of DataFrames in the order of tle_list.
+    """
+    start_time = datetime.utcnow()
+    jobs = [(gs, sim, tle_lines, start_time) for tle_lines in tle_list]
+    if len(jobs) <= 1:
+        return [records_to_dataframe(_simulate_one(job)) for job in jobs]
     
-    # Convert to Skyfield time format
-    sf_times = ts.utc([t.year for t in times], [t.month for t in times], [t.day for t in times],
-                      [t.hour for t in times], [t.minute for t in times], [t.second for t in times])
-
-    # Ground station location (corrected API usage)
-    gs_topos = wgs84.latlon(lat, lon, elevation_m=alt)
-
-    # Results
-    records = []
-    for t, sf_time in zip(times, sf_times):
-        # Satellite position relative to ground station
-        difference = satellite - gs_topos
-        topocentric = difference.at(sf_time)
-        el, az, distance = topocentric.altaz()
-        
-        # Radial velocity (range rate) - simplified calculation
-        try:
-            # Get velocity vector and project onto line of sight
-            velocity_vector = topocentric.velocity.km_per_s
-            # For simplicity, use the magnitude of velocity as radial component
-            velocity = np.linalg.norm(velocity_vector)
-        except Exception:
-            velocity = 7.0  # Default LEO velocity in km/s
-        
-        # Flag if below horizon
-        below_horizon = el.degrees < 0
-        records.append({
-            'time': t.strftime('%Y-%m-%d %H:%M:%S'),
-            'azimuth': az.degrees,
-            'elevation': el.degrees,
-            'range': distance.km,
-            'velocity': velocity,
-            'below_horizon': below_horizon
-        })
-    df = pd.DataFrame(records)
-    return df
+    # SGP4 propagation is CPU-bound; each worker loads its timescale once at startup.
+    # Workers return record arrays, which pickle as one flat buffer
+    workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_get_timescale) as executor:
+        return [records_to_dataframe(records) for records in executor.map(_simulate_one, jobs)]
+
+
+def write_csv(df, path):
+    """
+    Write a DataFrame to CSV in chunks of CSV_CHUNK_ROWS rows.
+    Long simulations are streamed to one open file instead of being formatted into a
+    single in-memory string first.
+    """
+    with open(path, 'w', newline='') as f:
+        for start in range(0, max(len(df), 1), CSV_CHUNK_ROWS):
+            df.iloc[start:start + CSV_CHUNK_ROWS].to_csv(
+                f, index=False, header=(start == 0), float_format=CSV_FLOAT_FORMAT)
 
 
 def main():
@@ -122,7 +224,7 @@ def main():
         df = simulate_flyby(gs, sim, tle_lines)
         # Save to CSV
         os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
-        df.to_csv(LOG_PATH, index=False)
+        write_csv(df, LOG_PATH)
         print(f"Simulation complete. Results saved to {LOG_PATH}")
         print(f"Generated {len(df)} data points")
         print("\nFirst few results:")
@@ -1,30 +1,72 @@
 """
 LEO Satellite Signal Emulator
 - Calculates Doppler shift, path loss, SNR, and atmospheric attenuation.
-- Reads orbit data from pandas DataFrame and signal parameters from config.
+- Reads orbit data from pandas DataFrame (or a dict of arrays) and signal parameters from config.
 - Outputs results as a pandas DataFrame and logs to data/logs/signal_log.csv.
+- Uses a fused Numba kernel for the per-sample math when Numba is installed,
+  otherwise numexpr (if available) or plain NumPy.
 """
 import os
 import sys
+import math
+import functools
 import yaml
 import numpy as np
 import pandas as pd
 from datetime import datetime
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    prange = range
+    NUMBA_AVAILABLE = False
+
+try:
+    import numexpr as ne
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+
+# Prefer the LibYAML-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 # Constants
 CONFIG_PATH = 'config/sim_config.yaml'
 LOG_PATH = 'data/logs/signal_log.csv'
+CSV_FLOAT_FORMAT = '%.6g'  # 6 significant digits keeps the log compact
+CSV_CHUNK_ROWS = 65536     # rows formatted per write, bounds the CSV text buffer
+# Orbit log columns used by the signal model and their dtypes; the rest are not parsed
+ORBIT_COLUMNS = {'time': str, 'range': np.float64, 'velocity': np.float64,
+                 'elevation': np.float32}
 C = 299792458  # Speed of light in m/s
 K = 1.380649e-23  # Boltzmann constant in J/K
 T_SYS = 290  # System noise temperature in K
+FSPL_K = 20 * math.log10(4 * math.pi / C)  # Constant FSPL term 20*log10(4π/c)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml_cached(path, mtime_ns, size):
+    """Parse a YAML file once per (path, mtime, size); edits to the file invalidate it."""
+    with open(path, 'rb') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def _load_yaml(path):
+    """Load a YAML file, reusing the parsed result while the file is unchanged."""
+    st = os.stat(path)
+    return _load_yaml_cached(os.path.abspath(path), st.st_mtime_ns, st.st_size)
 
 
 def load_signal_config(config_path):
     """Load signal parameters from YAML config."""
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
-        signal_config = config.get('signal', {})
+        config = _load_yaml(config_path)
+        # Copy, so callers cannot modify the cached config
+        signal_config = dict(config.get('signal', {}))
         return signal_config
     except Exception as e:
         raise RuntimeError(f"Failed to load signal config: {e}")
@@ -33,6 +75,7 @@ def load_signal_config(config_path):
 def calculate_doppler_shift(velocity_km_s, frequency_hz):
     """
     Calculate Doppler shift in Hz.
+    Accepts scalars or NumPy arrays (broadcast elementwise).
     Args:
         velocity_km_s: Radial velocity in km/s
         frequency_hz: Carrier frequency in Hz
@@ -47,31 +90,31 @@ def calculate_doppler_shift(velocity_km_s, frequency_hz):
 def calculate_path_loss(range_km, frequency_hz):
     """
     Calculate free-space path loss in dB.
+    Accepts scalars or NumPy arrays (broadcast elementwise).
     Args:
         range_km: Distance in km
         frequency_hz: Carrier frequency in Hz
     Returns:
         Path loss in dB
     """
-    if range_km <= 0:
+    range_km = np.asarray(range_km, dtype=np.float64)
+    if (range_km <= 0).any():
         raise ValueError("Range must be positive and non-zero for path loss calculation.")
-    range_m = range_km * 1000
-    # FSPL = 20*log10(d) + 20*log10(f) + 20*log10(4π/c)
-    path_loss = (20 * np.log10(range_m) + 
-                 20 * np.log10(frequency_hz) + 
-                 20 * np.log10(4 * np.pi / C))
+    # FSPL = 20*log10(d) + 20*log10(f) + 20*log10(4π/c), fused into a single log10
+    path_loss = 20 * np.log10(range_km * 1000 * frequency_hz) + FSPL_K
     return path_loss
 
 
 def calculate_thermal_noise(bandwidth_hz):
     """
     Calculate thermal noise power in dBm.
+    Accepts scalars or NumPy arrays.
     Args:
         bandwidth_hz: System bandwidth in Hz
     Returns:
         Noise power in dBm
     """
-    noise_power_w = K * T_SYS * bandwidth_hz
+    noise_power_w = K * T_SYS * np.asarray(bandwidth_hz, dtype=np.float64)
     noise_power_dbm = 10 * np.log10(noise_power_w * 1000)
     return noise_power_dbm
 
@@ -79,18 +122,15 @@ def calculate_thermal_noise(bandwidth_hz):
 def calculate_atmospheric_attenuation(elevation_deg, range_km):
     """
     Calculate atmospheric attenuation in dB.
+    Accepts scalars or NumPy arrays (branchless, so arrays are handled elementwise).
     Args:
         elevation_deg: Elevation angle in degrees
         range_km: Range in km
     Returns:
         Atmospheric attenuation in dB
     """
-    if elevation_deg < 10:
-        # Apply 0.1 dB/km for low elevation angles
-        attenuation = 0.1 * range_km
-    else:
-        # Negligible attenuation for high elevation angles
-        attenuation = 0.0
+    # Apply 0.1 dB/km for low elevation angles (< 10°); negligible above
+    attenuation = 0.1 * range_km * (elevation_deg < 10)
     return attenuation
 
 
@@ -114,14 +154,94 @@ def calculate_snr(tx_power_dbm, tx_gain_db, rx_gain_db, path_loss_db,
     return snr
 
 
-def simulate_signal(orbit_df, signal_config):
+def _signal_kernel(range_km, velocity_km_s, elevation_deg, below_horizon,
+                   doppler_k, range_k, link_budget):
     """
-    Simulate signal parameters for the entire orbit.
+    Compute Doppler, path loss, atmospheric loss and SNR for every sample in one loop.
+    Args:
+        range_km, velocity_km_s, elevation_deg: Contiguous float64 orbit arrays
+        below_horizon: Bool array of samples to skip (filled with NaN)
+        doppler_k, range_k, link_budget: Folded link constants (see make_signal_kernel)
+    Returns:
+        Tuple of arrays (doppler_shift, path_loss, atmospheric_loss, snr); Doppler is
+        float64, the dB values are float32
+    """
+    n = range_km.shape[0]
+    doppler_shift = np.empty(n)
+    path_loss = np.empty(n, dtype=np.float32)
+    atmospheric_loss = np.empty(n, dtype=np.float32)
+    snr = np.empty(n, dtype=np.float32)
+
+    for i in prange(n):
+        if below_horizon[i]:
+            doppler_shift[i] = np.nan
+            path_loss[i] = np.nan
+            atmospheric_loss[i] = np.nan
+            snr[i] = np.nan
+            continue
+        rng = range_km[i]
+        pl = 20 * math.log10(rng * range_k) + FSPL_K
+        atm = 0.1 * rng * (elevation_deg[i] < 10)
+        doppler_shift[i] = velocity_km_s[i] * doppler_k
+        path_loss[i] = pl
+        atmospheric_loss[i] = atm
+        snr[i] = link_budget - pl - atm
+
+    return doppler_shift, path_loss, atmospheric_loss, snr
+
+
+if NUMBA_AVAILABLE:
+    # The on-disk cache records the importing module's name, so it is only used when
+    # imported (running this file as a script would otherwise load an unimportable cache)
+    signal_kernel = njit(parallel=True, fastmath=True,
+                         cache=__name__ != '__main__')(_signal_kernel)
+else:
+    signal_kernel = None
+
+
+def _numpy_signal_kernel(range_km, velocity_km_s, elevation_deg, below_horizon,
+                         doppler_k, range_k, link_budget):
+    """NumPy/numexpr equivalent of _signal_kernel, used when Numba is not installed."""
+    n = range_km.shape[0]
+    doppler_shift = np.full(n, np.nan)
+    path_loss = np.full(n, np.nan, dtype=np.float32)
+    atmospheric_loss = np.full(n, np.nan, dtype=np.float32)
+    snr = np.full(n, np.nan, dtype=np.float32)
+    
+    # Only visible samples are computed; the rest keep their NaN fill
+    visible = np.flatnonzero(~below_horizon)
+    if visible.size == 0:
+        return doppler_shift, path_loss, atmospheric_loss, snr
+    rng = range_km[visible]
+    el = elevation_deg[visible]
+    
+    doppler_shift[visible] = velocity_km_s[visible] * doppler_k
+    if NUMEXPR_AVAILABLE:
+        # Single multithreaded pass per expression, without NumPy temporaries
+        local_dict = {'rng': rng, 'el': el, 'range_k': range_k,
+                      'fspl_k': FSPL_K, 'link_budget': link_budget}
+        pl = ne.evaluate('20 * log10(rng * range_k) + fspl_k', local_dict=local_dict)
+        atm = ne.evaluate('where(el < 10, 0.1 * rng, 0.0)', local_dict=local_dict)
+        local_dict.update(pl=pl, atm=atm)
+        snr[visible] = ne.evaluate('link_budget - pl - atm', local_dict=local_dict)
+    else:
+        pl = 20 * np.log10(rng * range_k) + FSPL_K
+        atm = calculate_atmospheric_attenuation(el, rng)
+        snr[visible] = link_budget - pl - atm
+    # dB values are kept as float32, like the kernel output
+    path_loss[visible] = pl
+    atmospheric_loss[visible] = atm
+    return doppler_shift, path_loss, atmospheric_loss, snr
+
+
+def link_constants(signal_config):
+    """
+    Fold a signal configuration into the constants used by the signal kernels.
     Args:
-        orbit_df: Pandas DataFrame with orbit data (time, range, velocity, elevation)
         signal_config: Dictionary with signal parameters
     Returns:
-        Pandas DataFrame with signal simulation results
+        Tuple (doppler_k, range_k, link_budget): Doppler Hz per km/s, the range-to-
+        metres-times-frequency factor for path loss, and P_tx + G_tx + G_rx - N in dB
     """
     # Extract signal parameters
     frequency_hz = float(signal_config.get('frequency_hz', 437e6))
@@ -133,57 +253,106 @@ def simulate_signal(orbit_df, signal_config):
     # Calculate noise power
     noise_power_dbm = calculate_thermal_noise(bandwidth_hz)
     
-    # Initialize results list
-    records = []
+    doppler_k = 1000 * frequency_hz / C
+    range_k = 1000 * frequency_hz
+    link_budget = tx_power_dbm + tx_gain_db + rx_gain_db - noise_power_dbm
+    return doppler_k, range_k, link_budget
+
+
+def make_signal_kernel(signal_config):
+    """
+    Specialize the per-sample signal math for one signal configuration.
+    The configuration is constant for a whole run, so the transmit/receive gains, noise
+    power and frequency terms are folded into three constants once, here, rather than
+    on every call. Create the kernel after loading the config and reuse it.
+    Args:
+        signal_config: Dictionary with signal parameters
+    Returns:
+        Function (range_km, velocity_km_s, elevation_deg, below_horizon) returning the
+        (doppler_shift, path_loss, atmospheric_loss, snr) arrays
+    """
+    doppler_k, range_k, link_budget = link_constants(signal_config)
+    kernel = signal_kernel if signal_kernel is not None else _numpy_signal_kernel
+    
+    def specialized_kernel(range_km, velocity_km_s, elevation_deg, below_horizon):
+        return kernel(range_km, velocity_km_s, elevation_deg, below_horizon,
+                      doppler_k, range_k, link_budget)
+    
+    return specialized_kernel
+
+
+def _as_float_array(values):
+    """Return values as a contiguous float64 array; unparseable entries become NaN."""
+    if isinstance(values, np.ndarray) and values.dtype.kind == 'f':
+        return np.ascontiguousarray(values, dtype=np.float64)
+    return np.asarray(pd.to_numeric(values, errors='coerce'), dtype=np.float64)
+
+
+def simulate_signal_arrays(orbit, signal_config, kernel=None):
+    """
+    Simulate signal parameters for the entire orbit using plain NumPy arrays.
+    Args:
+        orbit: Mapping of column name to array-like (time, range, velocity, elevation),
+               e.g. a dict of arrays or a pandas DataFrame
+        signal_config: Dictionary with signal parameters
+        kernel: Optional result of make_signal_kernel(signal_config), to reuse across calls
+    Returns:
+        Dictionary of arrays with signal simulation results
+    """
+    if kernel is None:
+        kernel = make_signal_kernel(signal_config)
+    
+    # Extract orbit data as float arrays; unparseable entries become NaN
+    time = np.asarray(orbit['time'])
+    range_km = _as_float_array(orbit['range'])
+    velocity_km_s = _as_float_array(orbit['velocity'])
+    elevation_deg = _as_float_array(orbit['elevation'])
+    
+    # Rows with invalid data are reported once and treated like below-horizon samples
+    invalid = np.isnan(range_km) | np.isnan(velocity_km_s) | np.isnan(elevation_deg) | (range_km <= 0)
+    if invalid.any():
+        print(f"Warning: Invalid data at {int(invalid.sum())} time(s), "
+              f"first at {time[invalid.argmax()]}")
+    
+    # Skip if satellite is below horizon
+    below_horizon = invalid | (elevation_deg < 0)
     
-    for _, row in orbit_df.iterrows():
-        try:
-            # Extract orbit data
-            time = row['time']
-            range_km = float(row['range'])
-            velocity_km_s = float(row['velocity'])
-            elevation_deg = float(row['elevation'])
-            
-            # Skip if satellite is below horizon
-            if elevation_deg < 0:
-                records.append({
-                    'time': time,
-                    'doppler_shift': np.nan,
-                    'path_loss': np.nan,
-                    'snr': np.nan,
-                    'atmospheric_loss': np.nan,
-                    'below_horizon': True
-                })
-                continue
-            
-            # Calculate signal parameters
-            doppler_shift = calculate_doppler_shift(velocity_km_s, frequency_hz)
-            path_loss = calculate_path_loss(range_km, frequency_hz)
-            atmospheric_loss = calculate_atmospheric_attenuation(elevation_deg, range_km)
-            snr = calculate_snr(tx_power_dbm, tx_gain_db, rx_gain_db, 
-                              path_loss, atmospheric_loss, noise_power_dbm)
-            
-            records.append({
-                'time': time,
-                'doppler_shift': doppler_shift,
-                'path_loss': path_loss,
-                'snr': snr,
-                'atmospheric_loss': atmospheric_loss,
-                'below_horizon': False
-            })
-            
-        except (ValueError, TypeError) as e:
-            print(f"Warning: Invalid data at time {row.get('time', 'unknown')}: {e}")
-            records.append({
-                'time': row.get('time', ''),
-                'doppler_shift': np.nan,
-                'path_loss': np.nan,
-                'snr': np.nan,
-                'atmospheric_loss': np.nan,
-                'below_horizon': True
-            })
+    # Calculate signal parameters for all samples at once
+    doppler_shift, path_loss, atmospheric_loss, snr = kernel(
+        range_km, velocity_km_s, elevation_deg, below_horizon)
     
-    return pd.DataFrame(records)
+    return {
+        'time': time,
+        'doppler_shift': doppler_shift,
+        'path_loss': path_loss,
+        'snr': snr,
+        'atmospheric_loss': atmospheric_loss,
+        'below_horizon': below_horizon
+    }
+
+
+def simulate_signal(orbit_df, signal_config):
+    """
+    Simulate signal parameters for the entire orbit.
+    Args:
+        orbit_df: Pandas DataFrame with orbit data (time, range, velocity, elevation)
+        signal_config: Dictionary with signal parameters
+    Returns:
+        Pandas DataFrame with signal simulation results
+    """
+    return pd.DataFrame(simulate_signal_arrays(orbit_df, signal_config), copy=False)
+
+
+def write_csv(df, path):
+    """
+    Write a DataFrame to CSV in chunks of CSV_CHUNK_ROWS rows.
+    Long simulations are streamed to one open file instead of being formatted into a
+    single in-memory string first.
+    """
+    with open(path, 'w', newline='') as f:
+        for start in range(0, max(len(df), 1), CSV_CHUNK_ROWS):
+            df.iloc[start:start + CSV_CHUNK_ROWS].to_csv(
+                f, index=False, header=(start == 0), float_format=CSV_FLOAT_FORMAT)
 
 
 def main():
@@ -200,15 +369,16 @@ def main():
             sys.exit(1)
         
         # Load orbit data
-        orbit_df = pd.read_csv(orbit_log_path)
+        orbit_df = pd.read_csv(orbit_log_path, usecols=list(ORBIT_COLUMNS), dtype=ORBIT_COLUMNS)
         print(f"Loaded orbit data with {len(orbit_df)} points")
         
-        # Simulate signal
-        signal_df = simulate_signal(orbit_df, signal_config)
+        # Simulate signal on raw arrays; the DataFrame is only built for output
+        signal = simulate_signal_arrays(orbit_df, signal_config)
+        signal_df = pd.DataFrame(signal, copy=False)
         
         # Save results
         os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
-        signal_df.to_csv(LOG_PATH, index=False)
+        write_csv(signal_df, LOG_PATH)
         
         print(f"Signal simulation complete. Results saved to {LOG_PATH}")
         print(f"Signal parameters:")
@@ -218,8 +388,9 @@ def main():
         print(f"  Bandwidth: {signal_config.get('bandwidth_hz', 20000)/1e3:.1f} kHz")
         
         # Show summary statistics
-        valid_snr = signal_df[signal_df['snr'].notna()]['snr']
-        if len(valid_snr) > 0:
+        snr = signal['snr']
+        valid_snr = snr[~np.isnan(snr)]
+        if valid_snr.size > 0:
             print(f"\nSNR Statistics:")
             print(f"  Mean: {valid_snr.mean():.2f} dB")
             print(f"  Min: {valid_snr.min():.2f} dB")
@@ -3,7 +3,9 @@ LEO Satellite Antenna Tracking Simulator
 - Simulates antenna tracking with beamwidth and slew rate constraints
 - Calculates pointing error and lock status
 - Generates 2D and 3D tracking visualizations
-- Logs tracking performance to data/logs/tracking_log.csv
+- Logs tracking performance to data/logs/tracking_log.csv (plus a Parquet copy when
+  pyarrow is installed)
+- Compiles the sequential antenna slew loop with Numba when it is installed
 """
 import os
 import sys
@@ -13,9 +15,26 @@ import pandas as pd
 import matplotlib.pyplot as plt
 from datetime import datetime
 
+try:
+    from numba import njit, vectorize
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Parquet engine for the binary copy of the tracking log
+try:
+    import pyarrow
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
 # Constants
 CONFIG_PATH = 'config/sim_config.yaml'
 LOG_PATH = 'data/logs/tracking_log.csv'
+# Orbit log columns parsed straight to float32 for the tracking pipeline
+ORBIT_DTYPES = {'azimuth': np.float32, 'elevation': np.float32,
+                'range': np.float32, 'velocity': np.float32}
+PARQUET_LOG_PATH = 'data/logs/tracking_log.parquet'  # typed binary copy, written when pyarrow is installed
 
 
 def load_tracking_config(config_path):
@@ -29,13 +48,72 @@ def load_tracking_config(config_path):
         raise RuntimeError(f"Failed to load tracking config: {e}")
 
 
+def _antenna_walk(target_az, target_el, max_step, az0, el0):
+    """
+    Step the antenna towards each target in turn, limited to max_step degrees per axis.
+    
+    The running position is kept in float64 so rounding does not accumulate over
+    long passes; the outputs are float32 like the rest of the tracking pipeline.
+    
+    Args:
+        target_az: Target azimuths in degrees (one per time step; float32 array or list)
+        target_el: Target elevations in degrees (one per time step; float32 array or list)
+        max_step: Maximum movement per time step in degrees
+        az0, el0: Antenna position before the first step
+        
+    Returns:
+        tuple: (antenna_azimuth, antenna_elevation) float32 arrays after each step
+    """
+    n = len(target_az)
+    ant_az = np.empty(n, dtype=np.float32)
+    ant_el = np.empty(n, dtype=np.float32)
+    cur_az = az0
+    cur_el = el0
+    for i in range(n):
+        az_diff = target_az[i] - cur_az
+        el_diff = target_el[i] - cur_el
+        
+        # Handle azimuth wrap-around
+        if az_diff > 180:
+            az_diff -= 360
+        elif az_diff < -180:
+            az_diff += 360
+        
+        # Apply slew rate constraints and normalize azimuth to 0-360
+        cur_az = (cur_az + min(max(az_diff, -max_step), max_step)) % 360
+        cur_el = cur_el + min(max(el_diff, -max_step), max_step)
+        ant_az[i] = cur_az
+        ant_el[i] = cur_el
+    return ant_az, ant_el
+
+
+if NUMBA_AVAILABLE:
+    # An explicit signature compiles eagerly at import (so the first simulation is not
+    # penalised) and gives the on-disk cache a single, deterministic entry. The cache
+    # records the importing module's name, so it is only used when imported (running
+    # this file as a script would otherwise load an unimportable cache)
+    _antenna_walk = njit('Tuple((f4[:], f4[:]))(f4[:], f4[:], f8, f8, f8)',
+                         fastmath=True, cache=__name__ != '__main__')(_antenna_walk)
+
+
+if NUMBA_AVAILABLE:
+    @vectorize(['f4(f4, f4)', 'f8(f8, f8)'], cache=__name__ != '__main__')
+    def _perturb_elevation(el_deg, el_error):
+        """Add a pointing error to an elevation and clip to 0-90 degrees in one pass."""
+        return min(max(el_deg + el_error, 0.0), 90.0)
+else:
+    def _perturb_elevation(el_deg, el_error):
+        """Add a pointing error to an elevation and clip to 0-90 degrees."""
+        return np.clip(el_deg + el_error, 0, 90)
+
+
 class TrackingSimulator:
     """
     Simulates antenna tracking with realistic constraints.
     Handles beamwidth, slew rate, pointing errors, and lock status.
     """
     
-    def __init__(self, beamwidth_deg=10.0, slew_rate_deg_s=5.0, pointing_error_deg=0.5):
+    def __init__(self, beamwidth_deg=10.0, slew_rate_deg_s=5.0, pointing_error_deg=0.5, seed=None):
         """
         Initialize tracking simulator.
         
@@ -43,10 +121,16 @@ class TrackingSimulator:
             beamwidth_deg: Antenna beamwidth in degrees
             slew_rate_deg_s: Maximum slew rate in degrees/second
             pointing_error_deg: RMS pointing error in degrees
+            seed: Optional seed for the pointing error generator (for reproducible runs)
         """
         self.beamwidth_deg = float(beamwidth_deg)
         self.slew_rate_deg_s = float(slew_rate_deg_s)
         self.pointing_error_deg = float(pointing_error_deg)
+        self.rng = np.random.default_rng(seed)
+        
+        # Derived limits, computed once instead of per sample
+        self._half_bw = self.beamwidth_deg * 0.5
+        self.set_time_step(1.0)
         
         # Current antenna position
         self.current_az_deg = 0.0
@@ -55,11 +139,24 @@ class TrackingSimulator:
         # Tracking statistics
         self.total_points = 0
         self.locked_points = 0
-        self.tracking_errors = []
+        # Running pointing error stats (visible samples only), O(1) memory for long runs
+        self._err_sum = 0.0
+        self._err_max = 0.0
+        self._err_count = 0
         
         # Create log directory
         os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
 
+    def set_time_step(self, time_step_sec):
+        """
+        Set the time between tracking samples.
+        
+        Args:
+            time_step_sec: Time step in seconds (sets the per-step slew limit)
+        """
+        self.time_step_sec = float(time_step_sec)
+        self._max_step = self.slew_rate_deg_s * self.time_step_sec
+
     def is_target_in_beam(self, target_az_deg, target_el_deg, antenna_az_deg, antenna_el_deg):
         """
         Check if target is within antenna beam.
@@ -80,7 +177,7 @@ class TrackingSimulator:
         el_diff = abs(target_el_deg - antenna_el_deg)
         
         # Check if within beamwidth
-        in_beam = (az_diff <= self.beamwidth_deg / 2) and (el_diff <= self.beamwidth_deg / 2)
+        in_beam = (az_diff <= self._half_bw) and (el_diff <= self._half_bw)
         return in_beam
 
     def apply_pointing_error(self, az_deg, el_deg):
@@ -88,21 +185,20 @@ class TrackingSimulator:
         Apply realistic pointing error to antenna position.
         
         Args:
-            az_deg: Desired azimuth in degrees
-            el_deg: Desired elevation in degrees
+            az_deg: Desired azimuth in degrees (scalar or array)
+            el_deg: Desired elevation in degrees (same shape as az_deg)
             
         Returns:
             tuple: (azimuth_with_error, elevation_with_error)
         """
-        # Add Gaussian pointing error
-        az_error = np.random.normal(0, self.pointing_error_deg)
-        el_error = np.random.normal(0, self.pointing_error_deg)
+        # Add Gaussian pointing error (all az, el pairs drawn in one call, as float32)
+        errors = self.rng.standard_normal(np.shape(az_deg) + (2,), dtype=np.float32)
+        errors *= np.float32(self.pointing_error_deg)
         
-        az_with_error = az_deg + az_error
-        el_with_error = el_deg + el_error
+        az_with_error = az_deg + errors[..., 0]
         
         # Ensure elevation stays within valid range
-        el_with_error = np.clip(el_with_error, 0, 90)
+        el_with_error = _perturb_elevation(el_deg, errors[..., 1])
         
         return az_with_error, el_with_error
 
@@ -129,11 +225,13 @@ class TrackingSimulator:
             az_diff += 360
         
         # Apply slew rate constraints
-        max_az_step = self.slew_rate_deg_s * time_step_sec
-        max_el_step = self.slew_rate_deg_s * time_step_sec
+        if time_step_sec == self.time_step_sec:
+            max_step = self._max_step
+        else:
+            max_step = self.slew_rate_deg_s * time_step_sec
         
-        az_step = np.clip(az_diff, -max_az_step, max_az_step)
-        el_step = np.clip(el_diff, -max_el_step, max_el_step)
+        az_step = np.clip(az_diff, -max_step, max_step)
+        el_step = np.clip(el_diff, -max_step, max_step)
         
         # Update antenna position
         self.current_az_deg += az_step
@@ -145,8 +243,9 @@ class TrackingSimulator:
         # Apply pointing error
         actual_az, actual_el = self.apply_pointing_error(self.current_az_deg, self.current_el_deg)
         
-        # Calculate pointing error
-        pointing_error = np.sqrt((target_az_deg - actual_az)**2 + (target_el_deg - actual_el)**2)
+        # Calculate pointing error (shortest angular distance in azimuth)
+        az_err = abs(target_az_deg - actual_az)
+        pointing_error = np.hypot(min(az_err, 360 - az_err), target_el_deg - actual_el)
         
         return actual_az, actual_el, pointing_error
 
@@ -161,73 +260,88 @@ class TrackingSimulator:
         Returns:
             DataFrame: Tracking simulation results
         """
-        records = []
-        
-        for _, orbit_row in orbit_df.iterrows():
-            try:
-                time = orbit_row['time']
-                target_az = float(orbit_row['azimuth'])
-                target_el = float(orbit_row['elevation'])
-                range_km = float(orbit_row['range'])
-                below_horizon = orbit_row.get('below_horizon', False)
-                
-                # Skip if below horizon
-                if below_horizon or target_el < 0:
-                    records.append({
-                        'time': time,
-                        'target_azimuth': target_az,
-                        'target_elevation': target_el,
-                        'antenna_azimuth': 0,
-                        'antenna_elevation': 0,
-                        'pointing_error': 999,
-                        'in_beam': False,
-                        'locked': False,
-                        'range_km': range_km
-                    })
-                    continue
-                
-                # Move antenna to target
-                actual_az, actual_el, pointing_error = self.move_antenna(target_az, target_el)
-                
-                # Check if in beam
-                in_beam = self.is_target_in_beam(target_az, target_el, actual_az, actual_el)
-                
-                # Check lock status (in beam and good signal)
-                locked = in_beam
-                
-                # Update statistics
-                self.total_points += 1
-                if locked:
-                    self.locked_points += 1
-                self.tracking_errors.append(pointing_error)
-                
-                records.append({
-                    'time': time,
-                    'target_azimuth': target_az,
-                    'target_elevation': target_el,
-                    'antenna_azimuth': actual_az,
-                    'antenna_elevation': actual_el,
-                    'pointing_error': pointing_error,
-                    'in_beam': in_beam,
-                    'locked': locked,
-                    'range_km': range_km
-                })
-                
-            except (ValueError, TypeError) as e:
-                print(f"Warning: Invalid tracking data at time {orbit_row.get('time', 'unknown')}: {e}")
-                records.append({
-                    'time': orbit_row.get('time', ''),
-                    'target_azimuth': 0,
-                    'target_elevation': 0,
-                    'antenna_azimuth': 0,
-                    'antenna_elevation': 0,
-                    'pointing_error': 999,
-                    'in_beam': False,
-                    'locked': False,
-                    'range_km': 0
-                })
-        
-        return pd.DataFrame(records)
+        # float32 throughout: tenth-of-a-degree accuracy needs far less than float64
+        time = orbit_df['time'].to_numpy()
+        target_az = pd.to_numeric(orbit_df['azimuth'], errors='coerce').to_numpy(dtype=np.float32, copy=True)
+        target_el = pd.to_numeric(orbit_df['elevation'], errors='coerce').to_numpy(dtype=np.float32, copy=True)
+        range_km = pd.to_numeric(orbit_df['range'], errors='coerce').to_numpy(dtype=np.float32, copy=True)
+        # Horizon flag checked once per column, not per row; missing flags count as visible
+        # (target_el < 0 below still catches those rows)
+        if 'below_horizon' in orbit_df.columns:
+            below_horizon = orbit_df['below_horizon'].to_numpy(dtype=bool, na_value=False)
+        else:
+            below_horizon = np.zeros(len(orbit_df), dtype=bool)
+        
+        # Rows with unparseable data are reported once and zeroed, like below-horizon rows
+        invalid = np.isnan(target_az) | np.isnan(target_el) | np.isnan(range_km)
+        if invalid.any():
+            print(f"Warning: Invalid tracking data at {int(invalid.sum())} time(s), "
+                  f"first at {time[invalid.argmax()]}")
+            target_az[invalid] = 0
+            target_el[invalid] = 0
+            range_km[invalid] = 0
+        
+        # Skip if below horizon
+        visible = ~(invalid | below_horizon | (target_el < 0))
+        vis_az = target_az[visible]
+        vis_el = target_el[visible]
+        
+        # Move antenna to target; the slew-limited walk is sequential, the rest is vectorized
+        max_step = self._max_step  # one time step per sample
+        if NUMBA_AVAILABLE:
+            walk_az, walk_el = vis_az, vis_el
+        else:
+            # The interpreted loop reads plain floats much faster than NumPy scalars
+            walk_az, walk_el = vis_az.tolist(), vis_el.tolist()
+        ant_az, ant_el = _antenna_walk(walk_az, walk_el, max_step,
+                                       self.current_az_deg, self.current_el_deg)
+        if len(ant_az):
+            self.current_az_deg = float(ant_az[-1])
+            self.current_el_deg = float(ant_el[-1])
+        
+        # Apply Gaussian pointing error
+        actual_az, actual_el = self.apply_pointing_error(ant_az, ant_el)
+        
+        # Shortest angular distance in azimuth; shared by the error and the beam check
+        az_diff = np.abs(vis_az - actual_az)
+        az_diff = np.minimum(az_diff, 360 - az_diff)
+        el_diff = np.abs(vis_el - actual_el)
+        pointing_error = np.hypot(az_diff, el_diff)
+        
+        # Check if in beam
+        in_beam_vis = (az_diff <= self._half_bw) & (el_diff <= self._half_bw)
+        
+        # Update statistics (lock status = in beam)
+        self.total_points += len(vis_az)
+        self.locked_points += int(in_beam_vis.sum())
+        if len(pointing_error):
+            self._err_sum += float(pointing_error.sum(dtype=np.float64))
+            self._err_max = max(self._err_max, float(pointing_error.max()))
+            self._err_count += len(pointing_error)
+        
+        # Preallocated output columns hold the below-horizon defaults; visible rows are
+        # scattered in, and the DataFrame adopts the arrays without another copy
+        n = len(orbit_df)
+        antenna_azimuth = np.zeros(n, dtype=np.float32)
+        antenna_elevation = np.zeros(n, dtype=np.float32)
+        pointing_errors = np.full(n, 999.0, dtype=np.float32)
+        in_beam = np.zeros(n, dtype=bool)
+        antenna_azimuth[visible] = actual_az
+        antenna_elevation[visible] = actual_el
+        pointing_errors[visible] = pointing_error
+        in_beam[visible] = in_beam_vis
+        
+        return pd.DataFrame({
+            'time': time,
+            'target_azimuth': target_az,
+            'target_elevation': target_el,
+            'antenna_azimuth': antenna_azimuth,
+            'antenna_elevation': antenna_elevation,
+            'pointing_error': pointing_errors,
+            'in_beam': in_beam,
+            'locked': in_beam.copy(),
+            'range_km': range_km
+        }, copy=False)
 
     def generate_plots(self, tracking_df, save_path='data/plots/'):
         """
@@ -265,24 +379,29 @@ class TrackingSimulator:
             plt.subplot(2, 2, 2)
             times = range(len(valid_data))
             plt.plot(times, valid_data['pointing_error'], 'g-', linewidth=2)
-            plt.axhline(y=self.beamwidth_deg/2, color='r', linestyle='--', 
-                       alpha=0.5, label=f'Beamwidth/2 ({self.beamwidth_deg/2:.1f}°)')
+            plt.axhline(y=self._half_bw, color='r', linestyle='--', 
+                       alpha=0.5, label=f'Beamwidth/2 ({self._half_bw:.1f}°)')
             plt.xlabel('Time Step')
             plt.ylabel('Pointing Error (degrees)')
             plt.title('Pointing Error vs Time')
             plt.legend()
             plt.grid(True)
             
+            # Lock mask shared by the lock status and range plots
+            locked = valid_data['locked'].to_numpy(dtype=bool)
+            steps = valid_data.index.to_numpy()
+            ranges = valid_data['range_km'].to_numpy()
+            
             # 3. Lock Status
             plt.subplot(2, 2, 3)
-            locked_times = valid_data[valid_data['locked'] == True].index
-            unlocked_times = valid_data[valid_data['locked'] == False].index
+            locked_times = steps[locked]
+            unlocked_times = steps[~locked]
             
             if len(locked_times) > 0:
-                plt.scatter(locked_times, [1]*len(locked_times), c='green', 
+                plt.scatter(locked_times, np.ones(len(locked_times)), c='green', 
                            s=20, alpha=0.7, label='Locked')
             if len(unlocked_times) > 0:
-                plt.scatter(unlocked_times, [0]*len(unlocked_times), c='red', 
+                plt.scatter(unlocked_times, np.zeros(len(unlocked_times)), c='red', 
                            s=20, alpha=0.7, label='Unlocked')
             
             plt.xlabel('Time Step')
@@ -293,8 +412,8 @@ class TrackingSimulator:
             
             # 4. Range vs Lock Status
             plt.subplot(2, 2, 4)
-            locked_ranges = valid_data[valid_data['locked'] == True]['range_km']
-            unlocked_ranges = valid_data[valid_data['locked'] == False]['range_km']
+            locked_ranges = ranges[locked]
+            unlocked_ranges = ranges[~locked]
             
             if len(locked_ranges) > 0:
                 plt.hist(locked_ranges, bins=20, alpha=0.7, label='Locked', color='green')
@@ -337,8 +456,8 @@ class TrackingSimulator:
             'total_points': self.total_points,
             'locked_points': self.locked_points,
             'lock_percentage': (self.locked_points / self.total_points) * 100,
-            'avg_pointing_error': np.mean(self.tracking_errors) if self.tracking_errors else 0,
-            'max_pointing_error': np.max(self.tracking_errors) if self.tracking_errors else 0
+            'avg_pointing_error': self._err_sum / self._err_count if self._err_count else 0,
+            'max_pointing_error': self._err_max if self._err_count else 0
         }
 
 
@@ -363,7 +482,7 @@ def main():
             sys.exit(1)
         
         # Load data
-        orbit_df = pd.read_csv(orbit_log_path)
+        orbit_df = pd.read_csv(orbit_log_path, dtype=ORBIT_DTYPES)
         signal_df = pd.read_csv(signal_log_path)
         
         # Initialize tracking simulator
@@ -379,6 +498,10 @@ def main():
         # Save results
         tracking_df.to_csv(LOG_PATH, index=False)
         print(f"Tracking simulation complete. Results saved to {LOG_PATH}")
+        if PARQUET_AVAILABLE:
+            # Written after the CSV, so readers can tell it is the current copy
+            tracking_df.to_parquet(PARQUET_LOG_PATH, index=False)
+            print(f"Parquet copy saved to {PARQUET_LOG_PATH}")
         
         # Generate plots
         tracker.generate_plots(tracking_df)
@@ -5,39 +5,149 @@ Flask Dashboard for LEO Satellite Flyby Emulator
 - Includes interactive sliders for parameters
 - Serves at localhost:5000
 """
-from flask import Flask, render_template_string, request, jsonify
+from flask import Flask, Response, request, jsonify
 import yaml
 import pandas as pd
 import os
+import functools
 from datetime import datetime
 import plotly.graph_objs as go
+from plotly.offline import get_plotlyjs_version
 from plotter import plot_polar_tracking, plot_signal_metrics, plot_3d_trajectory
 
+# Multi-threaded production WSGI server when installed; Flask's dev server otherwise
+try:
+    from waitress import serve
+    WAITRESS_AVAILABLE = True
+except ImportError:
+    WAITRESS_AVAILABLE = False
+
+# Prefer the LibYAML-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Binary tracking log written by tracking_sim.py when pyarrow is installed
+try:
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
 app = Flask(__name__)
+app.debug = False
 
 # Configuration
 CONFIG_PATH = 'config/sim_config.yaml'
 ORBIT_LOG = 'data/logs/orbit_log.csv'
 SIGNAL_LOG = 'data/logs/signal_log.csv'
 TRACKING_LOG = 'data/logs/tracking_log.csv'
+TRACKING_PARQUET = 'data/logs/tracking_log.parquet'
+TAIL_BYTES = 4096  # enough to hold the last row of any log
+MAX_PLOT_ROWS = 5000  # points per dashboard plot; longer logs are strided down
+SERVER_THREADS = 8  # waitress worker threads (status polls from several browsers)
+PLOTLYJS_URL = f'https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js'
+
+# (path, mtime, size) -> last row of that log, so status polls skip unchanged files
+_LAST_ROW_CACHE = {}
+
+@functools.lru_cache(maxsize=4)
+def _load_yaml_cached(path, mtime_ns, size):
+    """Parse a YAML file once per (path, mtime, size); edits to the file invalidate it."""
+    with open(path, 'rb') as f:
+        return yaml.load(f, Loader=_YamlLoader)
 
 def load_config():
-    """Load configuration from YAML file."""
+    """Load configuration from YAML file (re-parsed only when the file changes)."""
     try:
-        with open(CONFIG_PATH, 'r') as f:
-            return yaml.safe_load(f)
+        st = os.stat(CONFIG_PATH)
+        # Copy, so callers cannot modify the cached config
+        return dict(_load_yaml_cached(os.path.abspath(CONFIG_PATH), st.st_mtime_ns, st.st_size))
     except Exception as e:
         print(f"Error loading config: {e}")
         return {}
 
+def _parse_field(value):
+    """Convert one CSV field to float where possible, as pandas would."""
+    if value == '':
+        return float('nan')
+    if value in ('True', 'False'):
+        return value == 'True'
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+def _tracking_log_path():
+    """
+    Return the tracking log to read: the Parquet copy when it is readable and at
+    least as new as the CSV, otherwise the CSV.
+    """
+    if PARQUET_AVAILABLE and os.path.exists(TRACKING_PARQUET):
+        if (not os.path.exists(TRACKING_LOG)
+                or os.stat(TRACKING_PARQUET).st_mtime_ns >= os.stat(TRACKING_LOG).st_mtime_ns):
+            return TRACKING_PARQUET
+    return TRACKING_LOG
+
+def _last_csv_row(path, size):
+    """Parse the last row of a CSV file from its header line and last TAIL_BYTES."""
+    with open(path, 'rb') as f:
+        header = f.readline().decode('utf-8').strip().split(',')
+        header_end = f.tell()
+        f.seek(max(header_end, size - TAIL_BYTES))
+        lines = [line for line in f.read().split(b'\n') if line.strip()]
+    
+    if not lines:
+        return None
+    values = lines[-1].decode('utf-8').strip().split(',')
+    return {name: _parse_field(value) for name, value in zip(header, values)}
+
+def _last_parquet_row(path):
+    """Read the last row of a Parquet file, decoding only its last non-empty row group."""
+    parquet_file = pq.ParquetFile(path)
+    for group in reversed(range(parquet_file.num_row_groups)):
+        table = parquet_file.read_row_group(group)
+        if table.num_rows:
+            return table.slice(table.num_rows - 1).to_pylist()[0]
+    return None
+
+def _tail_row(path):
+    """
+    Return the last row of a CSV or Parquet log as a dict keyed by column name.
+    
+    Only the end of the file is read, and the result is cached until the file's
+    mtime or size changes.
+    
+    Args:
+        path: Path to the log file
+    
+    Returns:
+        dict: Column name -> value, or None if the file has no data rows
+    """
+    st = os.stat(path)
+    key = (path, st.st_mtime, st.st_size)
+    if key in _LAST_ROW_CACHE:
+        return _LAST_ROW_CACHE[key]
+    
+    if path.endswith('.parquet'):
+        row = _last_parquet_row(path)
+    else:
+        row = _last_csv_row(path, st.st_size)
+    
+    # Only the current version of each log is worth keeping
+    for stale in [k for k in _LAST_ROW_CACHE if k[0] == path]:
+        del _LAST_ROW_CACHE[stale]
+    _LAST_ROW_CACHE[key] = row
+    return row
+
 def get_latest_data():
     """Get latest simulation data from log files."""
     data = {}
     try:
         if os.path.exists(ORBIT_LOG):
-            orbit_df = pd.read_csv(ORBIT_LOG)
-            if len(orbit_df) > 0:
-                latest = orbit_df.iloc[-1]
+            latest = _tail_row(ORBIT_LOG)
+            if latest is not None:
                 data['orbit'] = {
                     'azimuth': latest['azimuth'],
                     'elevation': latest['elevation'],
@@ -49,9 +159,8 @@ def get_latest_data():
     
     try:
         if os.path.exists(SIGNAL_LOG):
-            signal_df = pd.read_csv(SIGNAL_LOG)
-            if len(signal_df) > 0:
-                latest = signal_df.iloc[-1]
+            latest = _tail_row(SIGNAL_LOG)
+            if latest is not None:
                 data['signal'] = {
                     'doppler_shift': latest['doppler_shift'],
                     'path_loss': latest['path_loss'],
@@ -61,10 +170,10 @@ def get_latest_data():
         print(f"Error reading signal data: {e}")
     
     try:
-        if os.path.exists(TRACKING_LOG):
-            tracking_df = pd.read_csv(TRACKING_LOG)
-            if len(tracking_df) > 0:
-                latest = tracking_df.iloc[-1]
+        tracking_log = _tracking_log_path()
+        if os.path.exists(tracking_log):
+            latest = _tail_row(tracking_log)
+            if latest is not None:
                 data['tracking'] = {
                     'antenna_az': latest['antenna_az'],
                     'antenna_el': latest['antenna_el'],
@@ -76,36 +185,79 @@ def get_latest_data():
     
     return data
 
-@app.route('/')
-def dashboard():
-    """Main dashboard page with plots and controls."""
-    config = load_config()
+def _read_plot_log(path):
+    """
+    Read a CSV or Parquet log for plotting, keeping at most MAX_PLOT_ROWS evenly spaced rows.
+    
+    Long simulations would otherwise hand Plotly hundreds of thousands of points;
+    striding keeps the shape of the whole pass while bounding the figure size.
+    
+    Args:
+        path: Path to the log file
     
-    # Generate plots
-    plots_html = {}
+    Returns:
+        pd.DataFrame: The (possibly downsampled) log
+    """
+    df = pd.read_parquet(path) if path.endswith('.parquet') else pd.read_csv(path)
+    stride = -(-len(df) // MAX_PLOT_ROWS)  # ceil division
+    if stride > 1:
+        df = df.iloc[::stride].reset_index(drop=True)
+    return df
+
+def _log_mtimes():
+    """
+    Return the modification times of the orbit, signal and tracking logs.
+    
+    Returns:
+        tuple: mtimes in nanoseconds, or None if any log is missing
+    """
     try:
-        if all(os.path.exists(f) for f in [ORBIT_LOG, SIGNAL_LOG, TRACKING_LOG]):
-            orbit_df = pd.read_csv(ORBIT_LOG)
-            signal_df = pd.read_csv(SIGNAL_LOG)
-            tracking_df = pd.read_csv(TRACKING_LOG)
-            
-            # Generate plot HTML
-            polar_fig = plot_polar_tracking(tracking_df)
-            plots_html['polar'] = polar_fig.to_html(full_html=False, include_plotlyjs='cdn')
-            
-            signal_fig = plot_signal_metrics(signal_df)
-            plots_html['signal'] = signal_fig.to_html(full_html=False, include_plotlyjs='cdn')
-            
-            traj_fig = plot_3d_trajectory(orbit_df, tracking_df)
-            plots_html['trajectory'] = traj_fig.to_html(full_html=False, include_plotlyjs='cdn')
+        return tuple(os.stat(f).st_mtime_ns for f in [ORBIT_LOG, SIGNAL_LOG, _tracking_log_path()])
+    except OSError:
+        return None
+
+@functools.lru_cache(maxsize=1)
+def _build_plot_json(log_mtimes):
+    """
+    Render the dashboard plots to Plotly figure JSON.
+    
+    Args:
+        log_mtimes: Modification times of the orbit, signal and tracking logs.
+            Only used as the cache key, so the plots are rebuilt when a log changes.
+    
+    Returns:
+        dict: Plot name -> figure JSON string (missing entries if rendering failed)
+    """
+    plots_json = {}
+    try:
+        orbit_df = _read_plot_log(ORBIT_LOG)
+        signal_df = _read_plot_log(SIGNAL_LOG)
+        tracking_df = _read_plot_log(_tracking_log_path())
+        
+        # Generate plot JSON
+        plots_json['polar'] = plot_polar_tracking(tracking_df).to_json()
+        plots_json['signal'] = plot_signal_metrics(signal_df).to_json()
+        plots_json['trajectory'] = plot_3d_trajectory(orbit_df, tracking_df).to_json()
     except Exception as e:
         print(f"Error generating plots: {e}")
+    return plots_json
+
+def _conditional(response, etag):
+    """
+    Tag a response and reduce it to 304 Not Modified if the client already has it.
     
-    # Get latest data
-    latest_data = get_latest_data()
+    Args:
+        response: Response to send
+        etag: Entity tag identifying the response content
     
-    # HTML template
-    html_template = '''
+    Returns:
+        Response: The tagged response, or an empty 304 response
+    """
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+# Dashboard page, parsed and compiled once at import; plots are fetched from /api/plot/<name>
+DASHBOARD_TEMPLATE = app.jinja_env.from_string('''
     <!DOCTYPE html>
     <html>
     <head>
@@ -121,6 +273,7 @@ def dashboard():
             input[type="range"] { width: 200px; }
             .value-display { display: inline-block; margin-left: 10px; }
         </style>
+        <script src="{{ plotlyjs_url }}"></script>
     </head>
     <body>
         <div class="header">
@@ -132,17 +285,17 @@ def dashboard():
             <h3>Simulation Controls</h3>
             <div class="slider-container">
                 <label>Frequency (MHz):</label>
-                <input type="range" id="freq" min="100" max="1000" value="''' + str(config.get('signal', {}).get('frequency_hz', 437)/1e6) + '''" step="1">
+                <input type="range" id="freq" min="100" max="1000" value="{{ freq_default }}" step="1">
                 <span class="value-display" id="freq-value"></span>
             </div>
             <div class="slider-container">
                 <label>Duration (min):</label>
-                <input type="range" id="duration" min="1" max="30" value="''' + str(config.get('simulation', {}).get('duration_sec', 600)//60) + '''" step="1">
+                <input type="range" id="duration" min="1" max="30" value="{{ duration_default }}" step="1">
                 <span class="value-display" id="duration-value"></span>
             </div>
             <div class="slider-container">
                 <label>Time Step (sec):</label>
-                <input type="range" id="timestep" min="1" max="10" value="''' + str(config.get('simulation', {}).get('time_step_sec', 1)) + '''" step="1">
+                <input type="range" id="timestep" min="1" max="10" value="{{ timestep_default }}" step="1">
                 <span class="value-display" id="timestep-value"></span>
             </div>
             <button onclick="updateConfig()">Update Configuration</button>
@@ -159,21 +312,21 @@ def dashboard():
         <div class="plot-container">
             <h3>Antenna Tracking (Polar Plot)</h3>
             <div id="polar-plot">
-                ''' + plots_html.get('polar', '<p>No tracking data available</p>') + '''
+                <p>No tracking data available</p>
             </div>
         </div>
         
         <div class="plot-container">
             <h3>Signal Metrics</h3>
             <div id="signal-plot">
-                ''' + plots_html.get('signal', '<p>No signal data available</p>') + '''
+                <p>No signal data available</p>
             </div>
         </div>
         
         <div class="plot-container">
             <h3>3D Trajectory</h3>
             <div id="trajectory-plot">
-                ''' + plots_html.get('trajectory', '<p>No trajectory data available</p>') + '''
+                <p>No trajectory data available</p>
             </div>
         </div>
         
@@ -223,12 +376,38 @@ def dashboard():
             // Update status every second
             setInterval(updateStatus, 1000);
             updateStatus();
+            
+            // Plots are fetched separately; the browser revalidates them with their ETag
+            function loadPlot(name, elementId) {
+                fetch('/api/plot/' + name)
+                    .then(response => response.ok ? response.json() : null)
+                    .then(fig => {
+                        if (fig) {
+                            document.getElementById(elementId).innerHTML = '';
+                            Plotly.react(elementId, fig.data, fig.layout);
+                        }
+                    });
+            }
+            loadPlot('polar', 'polar-plot');
+            loadPlot('signal', 'signal-plot');
+            loadPlot('trajectory', 'trajectory-plot');
         </script>
     </body>
     </html>
-    '''
-    
-    return render_template_string(html_template)
+    ''')
+
+@app.route('/')
+def dashboard():
+    """Main dashboard page with plots and controls."""
+    config = load_config()
+    signal = config.get('signal', {})
+    simulation = config.get('simulation', {})
+    return DASHBOARD_TEMPLATE.render(
+        plotlyjs_url=PLOTLYJS_URL,
+        freq_default=signal.get('frequency_hz', 437) / 1e6,
+        duration_default=simulation.get('duration_sec', 600) // 60,
+        timestep_default=simulation.get('time_step_sec', 1),
+    )
 
 @app.route('/api/status')
 def api_status():
@@ -241,6 +420,20 @@ def api_status():
         'timestamp': datetime.now().isoformat()
     })
 
+@app.route('/api/plot/<name>')
+def api_plot(name):
+    """API endpoint for one dashboard plot as Plotly figure JSON."""
+    log_mtimes = _log_mtimes()
+    plots_json = _build_plot_json(log_mtimes) if log_mtimes else {}
+    if name not in plots_json:
+        return jsonify({'error': f'No {name} plot available'}), 404
+    
+    # A figure only changes when a log does, so the log mtimes identify it
+    etag = f"plot-{name}-" + '-'.join(str(m) for m in log_mtimes)
+    if request.if_none_match.contains(etag):
+        return _conditional(Response(), etag)
+    return _conditional(Response(plots_json[name], mimetype='application/json'), etag)
+
 @app.route('/api/update_config', methods=['POST'])
 def api_update_config():
     """API endpoint for updating configuration."""
@@ -255,4 +448,8 @@ def api_update_config():
 if __name__ == '__main__':
     print("Starting LEO Flyby Emulator Dashboard...")
     print("Access the dashboard at: http://localhost:5000")
-    app.run(debug=True, host='0.0.0.0', port=5000) 
\ No newline at end of file
+    if WAITRESS_AVAILABLE:
+        serve(app, host='0.0.0.0', port=5000, threads=SERVER_THREADS)
+    else:
+        app.run(debug=False, host='0.0.0.0', port=5000, threaded=True)
+ 
\ No newline at end of file
@@ -4,14 +4,129 @@ Plotter for LEO Satellite Flyby Visualization
 - Generates interactive Plotly plots and saves as HTML
 """
 import os
+import numpy as np
 import pandas as pd
 import plotly.graph_objs as go
 from plotly.subplots import make_subplots
 
+# Multithreaded CSV parser and Parquet reader for the batch loader when pyarrow is installed
+try:
+    import pyarrow
+    CSV_ENGINE = 'pyarrow'
+    PARQUET_AVAILABLE = True
+except ImportError:
+    CSV_ENGINE = 'c'
+    PARQUET_AVAILABLE = False
+
+# Shape-preserving (LTTB) downsampling of long signal series when plotly-resampler is installed
+try:
+    from plotly_resampler.aggregation import LTTB
+    LTTB_AVAILABLE = True
+except ImportError:
+    LTTB_AVAILABLE = False
+
 PLOT_DIR = 'data/plots/'
+# Column dtypes of the orbit/signal/tracking logs, so the batch loader skips type inference
+LOG_DTYPES = {'time': str, 'azimuth': np.float32, 'elevation': np.float32,
+              'range': np.float32, 'velocity': np.float32,
+              'doppler_shift': np.float32, 'path_loss': np.float32, 'snr': np.float32,
+              'atmospheric_loss': np.float32,
+              'antenna_az': np.float32, 'antenna_el': np.float32,
+              'pointing_error': np.float32, 'lock_status': str}
+MAX_MARKER_POINTS = 2000  # traces longer than this are drawn as lines only
+MAX_SIGNAL_POINTS = 2000  # signal series longer than this are downsampled
+# HTML export options: load plotly.js from the CDN instead of embedding ~3 MB per file
+_HTML_KW = dict(include_plotlyjs='cdn', full_html=True, config={'responsive': True})
 os.makedirs(PLOT_DIR, exist_ok=True)
 
 
+def _radians(df, column):
+    """
+    Angle column in radians, using a precomputed '<column>_rad' column when present.
+    Args:
+        df: DataFrame holding the angle column (degrees)
+        column: Column name
+    Returns:
+        np.ndarray of radians
+    """
+    rad_column = column + '_rad'
+    if rad_column in df:
+        return df[rad_column].to_numpy(copy=False)
+    return np.deg2rad(df[column].to_numpy())
+
+
+def add_radian_columns(df, columns=('azimuth', 'elevation', 'antenna_az', 'antenna_el')):
+    """
+    Precompute float32 '<column>_rad' columns for the angle columns present in df.
+    Args:
+        df: DataFrame to update in place
+        columns: Angle columns (degrees) to convert
+    Returns:
+        The same DataFrame
+    """
+    for column in columns:
+        if column in df:
+            df[column + '_rad'] = np.deg2rad(df[column].to_numpy()).astype(np.float32)
+    return df
+
+
+def _maybe_downsample(x, y, max_points=MAX_SIGNAL_POINTS):
+    """
+    Downsample a series to at most max_points samples.
+    Args:
+        x: Sample positions (array)
+        y: Sample values (array)
+        max_points: Maximum number of samples to keep
+    Returns:
+        tuple: (x, y) arrays, unchanged when already short enough
+    """
+    if len(y) <= max_points:
+        return x, y
+    if LTTB_AVAILABLE:
+        # Samples are evenly spaced, so LTTB can bucket on the index instead of x
+        idx = LTTB().arg_downsample(y, n_out=max_points)
+        return x[idx], y[idx]
+    stride = _stride(len(y), max_points)
+    return x[::stride], y[::stride]
+
+
+def _stride(n, max_points=MAX_SIGNAL_POINTS):
+    """Smallest stride that keeps at most max_points of n samples (ceil division)."""
+    return max(1, -(-n // max_points))
+
+
+def _uniform_step_ms(time):
+    """
+    Spacing of a time column, when all samples are evenly spaced.
+    Args:
+        time: 'YYYY-MM-DD HH:MM:SS' strings (array)
+    Returns:
+        Spacing in milliseconds, or None when uneven, unparseable or too short
+    """
+    try:
+        seconds = np.asarray(time, dtype='datetime64[s]').astype(np.int64)
+    except (ValueError, TypeError):
+        return None
+    steps = np.diff(seconds)
+    if len(steps) == 0 or steps[0] <= 0 or (steps != steps[0]).any():
+        return None
+    return int(steps[0]) * 1000
+
+
+def _sph2cart(r, az, el):
+    """
+    Convert range/azimuth/elevation to Cartesian coordinates.
+    Args:
+        r: Range (array or scalar)
+        az: Azimuth in radians (array)
+        el: Elevation in radians (array)
+    Returns:
+        tuple: (x, y, z) arrays
+    """
+    r_cos_el = r * np.cos(el)  # shared by x and y
+    return r_cos_el * np.cos(az), r_cos_el * np.sin(az), r * np.sin(el)
+
+
 def plot_polar_tracking(tracking_df, output_path=None):
     """
     Create a 2D polar plot of antenna azimuth/elevation.
@@ -21,14 +136,20 @@ def plot_polar_tracking(tracking_df, output_path=None):
     Returns:
         Plotly Figure
     """
+    antenna_az = tracking_df['antenna_az'].to_numpy()
+    antenna_el = tracking_df['antenna_el'].to_numpy()
+    lock_status = tracking_df['lock_status'].to_numpy()
+    # Long tracks skip the per-sample markers, which overlap into a solid line anyway
+    mode = 'lines+markers' if len(lock_status) <= MAX_MARKER_POINTS else 'lines'
+    colors = np.where(lock_status == 'Locked', 'green', 'red')
     fig = go.Figure()
     fig.add_trace(go.Scatterpolar(
-        r=tracking_df['antenna_el'],
-        theta=tracking_df['antenna_az'],
-        mode='lines+markers',
-        marker=dict(color=(tracking_df['lock_status'] == 'Locked').map({True: 'green', False: 'red'})),
+        r=antenna_el,
+        theta=antenna_az,
+        mode=mode,
+        marker=dict(color=colors),
         name='Antenna Pointing',
-        text=tracking_df['lock_status'],
+        text=lock_status,
         hovertemplate='Az: %{theta:.2f}°<br>El: %{r:.2f}°<br>Status: %{text}'
     ))
     fig.update_layout(
@@ -40,7 +161,7 @@ def plot_polar_tracking(tracking_df, output_path=None):
         showlegend=True
     )
     if output_path:
-        fig.write_html(output_path)
+        fig.write_html(output_path, **_HTML_KW)
     return fig
 
 
@@ -53,24 +174,53 @@ def plot_signal_metrics(signal_df, output_path=None):
     Returns:
         Plotly Figure
     """
+    # Raw ndarrays take the serializer's array path (orjson, when installed) instead of
+    # per-Series conversion; times stay strings so hover labels are unchanged
+    time = signal_df['time'].to_numpy()
+    doppler_shift = signal_df['doppler_shift'].to_numpy()
+    path_loss = signal_df['path_loss'].to_numpy()
+    snr = signal_df['snr'].to_numpy()
+    mode = 'lines+markers' if len(time) <= MAX_MARKER_POINTS else 'lines'
+    series = (doppler_shift, path_loss, snr)
+    step_ms = None
+    if len(time) > MAX_SIGNAL_POINTS and LTTB_AVAILABLE:
+        # LTTB keeps different samples of each series, so each trace carries its own x
+        downsampled = [_maybe_downsample(time, y) for y in series]
+        x_specs = [dict(x=x) for x, _ in downsampled]
+        series = [y for _, y in downsampled]
+    else:
+        # All traces keep the same samples and share one x specification
+        stride = _stride(len(time))
+        series = [y[::stride] for y in series]
+        step_ms = _uniform_step_ms(time)
+        if step_ms is None:
+            x_spec = dict(x=time[::stride])
+        else:
+            # Evenly spaced: send the start time and spacing instead of a time array
+            x_spec = dict(x0=time[0], dx=step_ms * stride)
+        x_specs = [x_spec] * len(series)
+    # WebGL traces stay responsive for long time series where SVG slows down
     fig = make_subplots(rows=3, cols=1, shared_xaxes=True,
                         subplot_titles=('Doppler Shift (Hz)', 'Path Loss (dB)', 'SNR (dB)'))
-    fig.add_trace(go.Scatter(x=signal_df['time'], y=signal_df['doppler_shift'],
-                             mode='lines+markers', name='Doppler Shift',
-                             hovertemplate='Time: %{x}<br>Doppler: %{y:.2f} Hz'), row=1, col=1)
-    fig.add_trace(go.Scatter(x=signal_df['time'], y=signal_df['path_loss'],
-                             mode='lines+markers', name='Path Loss',
-                             hovertemplate='Time: %{x}<br>Path Loss: %{y:.2f} dB'), row=2, col=1)
-    fig.add_trace(go.Scatter(x=signal_df['time'], y=signal_df['snr'],
-                             mode='lines+markers', name='SNR',
-                             hovertemplate='Time: %{x}<br>SNR: %{y:.2f} dB'), row=3, col=1)
+    fig.add_trace(go.Scattergl(**x_specs[0], y=series[0],
+                               mode=mode, name='Doppler Shift',
+                               hovertemplate='Time: %{x}<br>Doppler: %{y:.2f} Hz'), row=1, col=1)
+    fig.add_trace(go.Scattergl(**x_specs[1], y=series[1],
+                               mode=mode, name='Path Loss',
+                               hovertemplate='Time: %{x}<br>Path Loss: %{y:.2f} dB'), row=2, col=1)
+    fig.add_trace(go.Scattergl(**x_specs[2], y=series[2],
+                               mode=mode, name='SNR',
+                               hovertemplate='Time: %{x}<br>SNR: %{y:.2f} dB'), row=3, col=1)
     fig.update_layout(title='Signal Metrics Over Time', height=900, showlegend=True)
+    if step_ms is not None:
+        # Without x data Plotly cannot infer the axis type from the times
+        fig.update_xaxes(type='date')
     fig.update_xaxes(title_text='Time', row=3, col=1)
     fig.update_yaxes(title_text='Doppler (Hz)', row=1, col=1)
     fig.update_yaxes(title_text='Path Loss (dB)', row=2, col=1)
     fig.update_yaxes(title_text='SNR (dB)', row=3, col=1)
     if output_path:
-        fig.write_html(output_path)
+        fig.write_html(output_path, **_HTML_KW)
     return fig
 
 
@@ -84,21 +234,24 @@ def plot_3d_trajectory(orbit_df, tracking_df, output_path=None):
     Returns:
         Plotly Figure
     """
+    sat_range = orbit_df['range'].to_numpy()
+    sat_az = _radians(orbit_df, 'azimuth')
+    sat_el = _radians(orbit_df, 'elevation')
+    ant_az = _radians(tracking_df, 'antenna_az')
+    ant_el = _radians(tracking_df, 'antenna_el')
     # Convert spherical to Cartesian for satellite
-    sat_x = orbit_df['range'] * np.cos(np.radians(orbit_df['elevation'])) * np.cos(np.radians(orbit_df['azimuth']))
-    sat_y = orbit_df['range'] * np.cos(np.radians(orbit_df['elevation'])) * np.sin(np.radians(orbit_df['azimuth']))
-    sat_z = orbit_df['range'] * np.sin(np.radians(orbit_df['elevation']))
+    sat_x, sat_y, sat_z = _sph2cart(sat_range, sat_az, sat_el)
     # Antenna (assume fixed radius for visualization)
-    ant_r = orbit_df['range'].mean() * 0.1
-    ant_x = ant_r * np.cos(np.radians(tracking_df['antenna_el'])) * np.cos(np.radians(tracking_df['antenna_az']))
-    ant_y = ant_r * np.cos(np.radians(tracking_df['antenna_el'])) * np.sin(np.radians(tracking_df['antenna_az']))
-    ant_z = ant_r * np.sin(np.radians(tracking_df['antenna_el']))
+    ant_r = np.nanmean(sat_range) * 0.1
+    ant_x, ant_y, ant_z = _sph2cart(ant_r, ant_az, ant_el)
+    sat_mode = 'lines+markers' if len(sat_x) <= MAX_MARKER_POINTS else 'lines'
+    ant_mode = 'lines+markers' if len(ant_x) <= MAX_MARKER_POINTS else 'lines'
     fig = go.Figure()
-    fig.add_trace(go.Scatter3d(x=sat_x, y=sat_y, z=sat_z, mode='lines+markers',
+    fig.add_trace(go.Scatter3d(x=sat_x, y=sat_y, z=sat_z, mode=sat_mode,
                                name='Satellite Trajectory',
                                marker=dict(size=3, color='blue'),
                                line=dict(color='blue')))
-    fig.add_trace(go.Scatter3d(x=ant_x, y=ant_y, z=ant_z, mode='lines+markers',
+    fig.add_trace(go.Scatter3d(x=ant_x, y=ant_y, z=ant_z, mode=ant_mode,
                                name='Antenna Pointing',
                                marker=dict(size=3, color='orange'),
                                line=dict(color='orange')))
@@ -112,17 +265,26 @@ def plot_3d_trajectory(orbit_df, tracking_df, output_path=None):
         legend=dict(x=0.01, y=0.99)
     )
     if output_path:
-        fig.write_html(output_path)
+        fig.write_html(output_path, **_HTML_KW)
     return fig
 
 
 # Example usage for batch plotting
 if __name__ == '__main__':
-    import numpy as np
     # Load data
-    orbit_df = pd.read_csv('data/logs/orbit_log.csv')
-    signal_df = pd.read_csv('data/logs/signal_log.csv')
-    tracking_df = pd.read_csv('data/logs/tracking_log.csv')
+    orbit_df = pd.read_csv('data/logs/orbit_log.csv', engine=CSV_ENGINE, dtype=LOG_DTYPES)
+    signal_df = pd.read_csv('data/logs/signal_log.csv', engine=CSV_ENGINE, dtype=LOG_DTYPES)
+    # Prefer the typed Parquet copy of the tracking log when it is current
+    tracking_csv = 'data/logs/tracking_log.csv'
+    tracking_parquet = 'data/logs/tracking_log.parquet'
+    if (PARQUET_AVAILABLE and os.path.exists(tracking_parquet)
+            and os.stat(tracking_parquet).st_mtime_ns >= os.stat(tracking_csv).st_mtime_ns):
+        tracking_df = pd.read_parquet(tracking_parquet)
+    else:
+        tracking_df = pd.read_csv(tracking_csv, engine=CSV_ENGINE, dtype=LOG_DTYPES)
+    # Convert angles to radians once for every figure
+    for df in (orbit_df, tracking_df):
+        add_radian_columns(df)
     # Plot and save
     plot_polar_tracking(tracking_df, os.path.join(PLOT_DIR, 'tracking_polar.html'))
     plot_signal_metrics(signal_df, os.path.join(PLOT_DIR, 'signal_plot.html'))
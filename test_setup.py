@@ -10,14 +10,37 @@ import sys
 import yaml
 import numpy as np
 import pandas as pd
-from scipy.interpolate import interp1d
+from scipy.interpolate import make_interp_spline
 import plotly.graph_objs as go
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    prange = range
+    NUMBA_AVAILABLE = False
+
+# Multithreaded CSV parser and a Parquet copy of the tracking log when pyarrow is installed
+try:
+    import pyarrow
+    CSV_ENGINE = 'pyarrow'
+    PARQUET_AVAILABLE = True
+except ImportError:
+    CSV_ENGINE = 'c'
+    PARQUET_AVAILABLE = False
+
 # Constants
 CONFIG_PATH = 'config/sim_config.yaml'
 ORBIT_LOG = 'data/logs/orbit_log.csv'
 TRACKING_LOG = 'data/logs/tracking_log.csv'
+TRACKING_PARQUET = 'data/logs/tracking_log.parquet'  # typed binary copy, written when pyarrow is installed
 PLOT_DIR = 'data/plots/'
+# HTML export options: load plotly.js from the CDN instead of embedding ~3 MB per file
+_HTML_KW = dict(include_plotlyjs='cdn', full_html=True, config={'responsive': True})
+# Orbit log column dtypes, so the loader skips type inference
+ORBIT_DTYPES = {'time': str, 'azimuth': np.float32, 'elevation': np.float32,
+                'range': np.float32, 'velocity': np.float32}
+LOCK_STATUS_CATEGORIES = ['Signal lost', 'Locked']  # indexed by the lock flag
 
 def load_antenna_config(config_path):
     """Load antenna parameters from YAML config."""
@@ -29,29 +52,100 @@ def load_antenna_config(config_path):
     except Exception as e:
         raise RuntimeError(f"Failed to load antenna config: {e}")
 
+def _slew_limit(values, max_delta):
+    """
+    Limit the change between consecutive samples to max_delta.
+    Args:
+        values: interpolated azimuth or elevation values (array or list)
+        max_delta: max change per time step in degrees
+    Returns:
+        np.array of slew-limited values
+    """
+    out = np.empty(len(values))
+    prev = values[0]
+    out[0] = prev
+    for i in range(1, len(values)):
+        delta = values[i] - prev
+        if delta > max_delta:
+            delta = max_delta
+        elif delta < -max_delta:
+            delta = -max_delta
+        prev = prev + delta
+        out[i] = prev
+    return out
+
+if NUMBA_AVAILABLE:
+    # Each step depends on the previous one, so the loop is compiled rather than vectorized.
+    # The on-disk cache is only used when imported (it records the importing module's name)
+    _slew_limit = njit(fastmath=True, cache=__name__ != '__main__')(_slew_limit)
+
+def _pointing_kernel(sat_az, sat_el, ant_az, ant_el, half_beam):
+    """
+    Pointing error and lock flag per sample, in one pass over the arrays.
+    Args:
+        sat_az, sat_el: satellite azimuth/elevation (degrees)
+        ant_az, ant_el: antenna azimuth/elevation (degrees)
+        half_beam: half the antenna beamwidth (degrees)
+    Returns:
+        tuple: (pointing_error, locked) arrays
+    """
+    n = len(sat_az)
+    half_beam_sq = half_beam * half_beam
+    pointing_error = np.empty(n)
+    locked = np.empty(n, dtype=np.bool_)
+    for i in prange(n):
+        d_az = ant_az[i] - sat_az[i]
+        d_el = ant_el[i] - sat_el[i]
+        error_sq = d_az * d_az + d_el * d_el
+        pointing_error[i] = np.sqrt(error_sq)
+        # Lock test on squared distances, independent of the sqrt
+        locked[i] = (error_sq < half_beam_sq) and (sat_el[i] >= 0)
+    return pointing_error, locked
+
+def _numpy_pointing_kernel(sat_az, sat_el, ant_az, ant_el, half_beam):
+    """NumPy version of _pointing_kernel, used when Numba is not installed."""
+    error_sq = (ant_az - sat_az)**2 + (ant_el - sat_el)**2
+    locked = (error_sq < half_beam * half_beam) & (sat_el >= 0)
+    return np.sqrt(error_sq, out=error_sq), locked
+
+if NUMBA_AVAILABLE:
+    pointing_kernel = njit(parallel=True, fastmath=True,
+                           cache=__name__ != '__main__')(_pointing_kernel)
+else:
+    pointing_kernel = _numpy_pointing_kernel
+
 def interpolate_track(times, values, slew_rate_deg_s, time_step=1.0):
     """
     Interpolate antenna motion with slew rate limit.
     Args:
         times: list of time indices (seconds)
-        values: list of azimuth or elevation values (degrees)
+        values: azimuth or elevation values (degrees), shape (N,); or several
+            axes at once, shape (N, k), sharing one spline fit
         slew_rate_deg_s: max slew rate in deg/s
         time_step: time step in seconds
     Returns:
-        np.array of interpolated values
+        np.array of interpolated values, same number of columns as values
     """
-    # Interpolate with cubic for smoothness
-    f = interp1d(times, values, kind='cubic', fill_value='extrapolate')
     interp_times = np.arange(times[0], times[-1]+1, time_step)
-    interp_values = f(interp_times)
-    # Apply slew rate limit
-    limited_values = [interp_values[0]]
-    for v in interp_values[1:]:
-        prev = limited_values[-1]
-        max_delta = slew_rate_deg_s * time_step
-        delta = np.clip(v - prev, -max_delta, max_delta)
-        limited_values.append(prev + delta)
-    return interp_times, np.array(limited_values)
+    if np.array_equal(interp_times, times):
+        # Output grid is the sample grid: the interpolant passes through the samples
+        interp_values = np.array(values, dtype=float)
+    else:
+        # Interpolate with cubic for smoothness (extrapolates past the last sample)
+        interp_values = make_interp_spline(times, values, k=3, axis=0)(interp_times)
+    # Apply slew rate limit to each axis
+    # (the interpreted loop reads plain floats faster than NumPy scalars)
+    max_delta = slew_rate_deg_s * time_step
+    if interp_values.ndim == 1:
+        columns = [interp_values]
+    else:
+        columns = list(interp_values.T)
+    if not NUMBA_AVAILABLE:
+        columns = [column.tolist() for column in columns]
+    limited = [_slew_limit(column, max_delta) for column in columns]
+    if interp_values.ndim == 1:
+        return interp_times, limited[0]
+    return interp_times, np.column_stack(limited)
 
 def simulate_tracking(orbit_df, antenna_config):
     """
@@ -65,29 +159,26 @@ def simulate_tracking(orbit_df, antenna_config):
     beamwidth = float(antenna_config.get('beamwidth_deg', 10))
     slew_rate = float(antenna_config.get('slew_rate_deg_s', 5))
     # Prepare time and az/el arrays
-    times = np.arange(len(orbit_df))
-    sat_az = orbit_df['azimuth'].values
-    sat_el = orbit_df['elevation'].values
-    # Interpolate antenna motion
-    interp_times, ant_az = interpolate_track(times, sat_az, slew_rate)
-    _, ant_el = interpolate_track(times, sat_el, slew_rate)
+    output_times = orbit_df['time'].to_numpy()  # original time column, used for output
+    sat_az = orbit_df['azimuth'].to_numpy(dtype=np.float64)
+    sat_el = orbit_df['elevation'].to_numpy(dtype=np.float64)
+    times = np.arange(len(sat_az))
+    # Interpolate antenna motion (azimuth and elevation share one spline fit)
+    interp_times, ant = interpolate_track(times, np.column_stack([sat_az, sat_el]), slew_rate)
+    ant_az = ant[:, 0]
+    ant_el = ant[:, 1]
     # Calculate pointing error and lock status
-    pointing_error = np.sqrt((ant_az - sat_az)**2 + (ant_el - sat_el)**2)
-    lock_status = np.where(
-        (pointing_error < beamwidth/2) & (sat_el >= 0),
-        'Locked',
-        'Signal lost'
-    )
-    # Use original time column for output
-    output_times = orbit_df['time'].values
-    # Build DataFrame
+    pointing_error, locked = pointing_kernel(sat_az, sat_el, ant_az, ant_el, beamwidth/2)
+    # Lock status as int8 codes into two categories instead of one string per row
+    lock_status = pd.Categorical.from_codes(locked.astype(np.int8), LOCK_STATUS_CATEGORIES)
+    # Build DataFrame from already-typed arrays, without copying them again
     df = pd.DataFrame({
         'time': output_times,
-        'antenna_az': ant_az,
-        'antenna_el': ant_el,
-        'pointing_error': pointing_error,
+        'antenna_az': ant_az.astype(np.float32),
+        'antenna_el': ant_el.astype(np.float32),
+        'pointing_error': pointing_error.astype(np.float32),
         'lock_status': lock_status
-    })
+    }, copy=False)
     return df
 
 def plot_tracking(df, orbit_df):
@@ -114,7 +205,7 @@ def plot_tracking(df, orbit_df):
             angularaxis=dict(direction='clockwise', rotation=90, title='Azimuth (deg)')
         )
     )
-    polar_fig.write_html(os.path.join(PLOT_DIR, 'tracking_polar.html'))
+    polar_fig.write_html(os.path.join(PLOT_DIR, 'tracking_polar.html'), **_HTML_KW)
 
     # 3D Trajectory Plot
     traj_fig = go.Figure()
@@ -134,7 +225,7 @@ def plot_tracking(df, orbit_df):
             zaxis_title='Time Index'
         )
     )
-    traj_fig.write_html(os.path.join(PLOT_DIR, 'tracking_3d.html'))
+    traj_fig.write_html(os.path.join(PLOT_DIR, 'tracking_3d.html'), **_HTML_KW)
 
 def main():
     """Main entry point for antenna tracking simulation."""
@@ -145,7 +236,7 @@ def main():
         if not os.path.exists(ORBIT_LOG):
             print(f"Error: Orbit log not found at {ORBIT_LOG}")
             sys.exit(1)
-        orbit_df = pd.read_csv(ORBIT_LOG)
+        orbit_df = pd.read_csv(ORBIT_LOG, engine=CSV_ENGINE, dtype=ORBIT_DTYPES)
         if len(orbit_df) == 0:
             print("Error: Orbit log is empty.")
             sys.exit(1)
@@ -155,6 +246,10 @@ def main():
         os.makedirs(os.path.dirname(TRACKING_LOG), exist_ok=True)
         tracking_df.to_csv(TRACKING_LOG, index=False)
         print(f"Tracking simulation complete. Results saved to {TRACKING_LOG}")
+        if PARQUET_AVAILABLE:
+            # Written after the CSV, so readers can tell it is the current copy
+            tracking_df.to_parquet(TRACKING_PARQUET, index=False, compression='zstd')
+            print(f"Parquet copy saved to {TRACKING_PARQUET}")
         # Generate plots
         plot_tracking(tracking_df, orbit_df)
         print(f"Plots saved to {PLOT_DIR}")
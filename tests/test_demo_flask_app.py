@@ -0,0 +1,87 @@
+"""
+Test suite for demo_flask_app.py module
+Tests the demo dashboard API endpoints against a stored simulation
+"""
+import pytest
+import sys
+import os
+import threading
+
+# Repository root, for running this file directly (pytest.ini adds it for pytest runs)
+_PARENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PARENT_DIR not in sys.path:
+    sys.path.insert(0, _PARENT_DIR)
+# demo_flask_app imports its simulation as the top-level module 'demo'
+_DEMO_DIR = os.path.join(_PARENT_DIR, 'demo')
+if _DEMO_DIR not in sys.path:
+    sys.path.insert(0, _DEMO_DIR)
+
+# The dashboard needs Flask and Matplotlib at import time
+pytest.importorskip("flask")
+pytest.importorskip("matplotlib")
+
+import demo_flask_app
+from demo import CONFIG, run_simulation
+
+
+class TestDemoFlaskApp:
+    """Test class for the demo dashboard API"""
+    
+    @pytest.fixture(scope='module')
+    def results(self):
+        """One simulation run, shared by the module's tests (read-only)"""
+        return run_simulation(CONFIG)
+    
+    @pytest.fixture
+    def client(self, results):
+        """Test client with the shared simulation stored in the app"""
+        demo_flask_app._set_simulation(results)
+        yield demo_flask_app.app.test_client()
+        demo_flask_app._set_simulation(None)
+    
+    def test_status_while_simulation_replaced(self, client, results):
+        """Status requests never fail while another thread keeps replacing the simulation"""
+        stop = threading.Event()
+        
+        def replace():
+            while not stop.is_set():
+                demo_flask_app._set_simulation(None)
+                demo_flask_app._set_simulation(results)
+        
+        writer = threading.Thread(target=replace)
+        writer.start()
+        try:
+            codes = {client.get(url).status_code
+                     for _ in range(100)
+                     for url in ('/api/status', '/api/status?time=30',
+                                 '/api/real_time?time=30', '/api/summary')}
+        finally:
+            stop.set()
+            writer.join()
+        
+        assert codes == {200}
+
+    
+    @pytest.mark.parametrize("time_arg, expected_idx", [
+        ('inf', -1), ('-inf', 0), ('nan', 0), ('1e400', -1), ('30', 30)
+    ], ids=['inf', 'neg_inf', 'nan', 'overflow', 'finite'])
+    def test_status_time(self, client, results, time_arg, expected_idx):
+        """Status for non-finite times clamps to the first/last sample instead of failing"""
+        response = client.get(f'/api/status?time={time_arg}')
+        
+        assert response.status_code == 200
+        assert response.get_json()['time_sec'] == results['time_sec'][expected_idx]
+    
+    @pytest.mark.parametrize("time_arg, expected_idx", [
+        ('inf', -1), ('-inf', 0), ('nan', -1), ('29.5', 30)
+    ], ids=['inf', 'neg_inf', 'nan', 'finite'])
+    def test_real_time_time(self, client, results, time_arg, expected_idx):
+        """Real-time data for non-finite times clamps to the first/last sample instead of failing"""
+        response = client.get(f'/api/real_time?time={time_arg}')
+        
+        assert response.status_code == 200
+        assert response.get_json()['time_sec'] == results['time_sec'][expected_idx]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
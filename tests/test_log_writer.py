@@ -0,0 +1,82 @@
+"""
+Test suite for log_writer.py module
+Tests the batch size, batch bytes and timer flush thresholds of the buffered log writer
+"""
+import pytest
+import sys
+import os
+import time
+
+# Repository root, for running this file directly (pytest.ini adds it for pytest runs)
+_PARENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PARENT_DIR not in sys.path:
+    sys.path.insert(0, _PARENT_DIR)
+
+from api_interface.log_writer import LogWriter, get_log_writer
+
+
+def _read(path):
+    """Current contents of the log file, as bytes"""
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+class TestLogWriter:
+    """Test class for LogWriter flushing"""
+    
+    @pytest.fixture
+    def log_path(self, tmp_path):
+        """Path of a log file in a not-yet-created directory"""
+        return str(tmp_path / 'logs' / 'test_log.txt')
+    
+    def test_flush_at_batch_size(self, log_path):
+        """Lines stay buffered until max_batch_size lines are queued"""
+        writer = LogWriter(log_path, max_batch_size=3, flush_interval=60)
+        writer.write('a\n')
+        writer.write('b\n')
+        assert _read(log_path) == b''
+        
+        writer.write('c\n')
+        assert _read(log_path) == b'a\nb\nc\n'
+        writer.close()
+    
+    def test_flush_at_batch_bytes(self, log_path):
+        """A batch is written once max_batch_bytes bytes are queued"""
+        writer = LogWriter(log_path, max_batch_bytes=8, flush_interval=60)
+        writer.write('1234\n')
+        assert _read(log_path) == b''
+        
+        writer.write('5678\n')
+        assert _read(log_path) == b'1234\n5678\n'
+        writer.close()
+    
+    def test_flush_on_timer(self, log_path):
+        """A lone line is written after flush_interval seconds"""
+        writer = LogWriter(log_path, flush_interval=0.05)
+        writer.write('tick\n')
+        assert _read(log_path) == b''
+        
+        deadline = time.monotonic() + 5
+        while _read(log_path) == b'' and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert _read(log_path) == b'tick\n'
+        writer.close()
+    
+    def test_close_flushes_and_drops_later_writes(self, log_path):
+        """close() writes pending lines; writes after close are ignored"""
+        writer = LogWriter(log_path, flush_interval=60)
+        writer.write('last\n')
+        writer.close()
+        writer.write('ignored\n')
+        
+        assert _read(log_path) == b'last\n'
+    
+    def test_shared_writer_per_path(self, log_path):
+        """get_log_writer returns one writer per absolute path"""
+        writer = get_log_writer(log_path)
+        assert get_log_writer(os.path.relpath(log_path)) is writer
+        writer.close()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
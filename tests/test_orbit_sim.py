@@ -8,17 +8,17 @@ import os
 import tempfile
 import yaml
 import numpy as np
-from datetime import datetime
+import pandas as pd
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Repository root, for running this file directly (pytest.ini adds it for pytest runs)
+_PARENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PARENT_DIR not in sys.path:
+    sys.path.insert(0, _PARENT_DIR)
+
+# orbit_sim needs Skyfield at import time, so skip the whole module without it
+pytest.importorskip("skyfield")
 
 from flyby_model.orbit_sim import load_config, load_tle, simulate_flyby
-try:
-    from skyfield.api import load
-    SKYFIELD_AVAILABLE = True
-except ImportError:
-    SKYFIELD_AVAILABLE = False
 
 # Sample TLE data for testing
 SAMPLE_TLE = """ISS (ZARYA)
@@ -42,21 +42,21 @@ SAMPLE_SIMULATION = {
 class TestOrbitSimulator:
     """Test class for orbit simulation functionality"""
     
-    @pytest.fixture
+    @pytest.fixture(scope='session')
     def temp_tle_file(self):
-        """Create a temporary TLE file for testing"""
+        """Create a temporary TLE file, shared by all tests (read-only)"""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
             f.write(SAMPLE_TLE)
             temp_path = f.name
         
         yield temp_path
         
-        # Cleanup
+        # Cleanup at session teardown
         os.unlink(temp_path)
     
-    @pytest.fixture
+    @pytest.fixture(scope='session')
     def temp_config_file(self):
-        """Create a temporary config file for testing"""
+        """Create a temporary config file, shared by all tests (read-only)"""
         config = {
             'ground_station': SAMPLE_GROUND_STATION,
             'simulation': SAMPLE_SIMULATION
@@ -68,14 +68,18 @@ class TestOrbitSimulator:
         
         yield temp_path
         
-        # Cleanup
+        # Cleanup at session teardown
         os.unlink(temp_path)
     
+    @pytest.fixture(scope='session')
+    def flyby_df(self, temp_tle_file, temp_config_file):
+        """Simulate the sample flyby once, shared by all tests (read-only)"""
+        gs, sim = load_config(temp_config_file)
+        tle_lines = load_tle(temp_tle_file)
+        return simulate_flyby(gs, sim, tle_lines)
+    
     def test_load_config_valid(self, temp_config_file):
         """Test loading valid configuration from YAML file"""
-        if not SKYFIELD_AVAILABLE:
-            pytest.skip("Skyfield not available")
-        
         gs, sim = load_config(temp_config_file)
         
         assert gs['latitude_deg'] == 37.7749
@@ -91,9 +95,6 @@ class TestOrbitSimulator:
     
     def test_load_tle_valid(self, temp_tle_file):
         """Test loading valid TLE from file"""
-        if not SKYFIELD_AVAILABLE:
-            pytest.skip("Skyfield not available")
-        
         name, line1, line2 = load_tle(temp_tle_file)
         
         assert name == "ISS (ZARYA)"
@@ -117,15 +118,9 @@ class TestOrbitSimulator:
         finally:
             os.unlink(temp_path)
     
-    def test_simulate_flyby_valid_data(self, temp_tle_file, temp_config_file):
+    def test_simulate_flyby_valid_data(self, flyby_df):
         """Test complete flyby simulation with valid data"""
-        if not SKYFIELD_AVAILABLE:
-            pytest.skip("Skyfield not available")
-        
-        gs, sim = load_config(temp_config_file)
-        tle_lines = load_tle(temp_tle_file)
-        
-        df = simulate_flyby(gs, sim, tle_lines)
+        df = flyby_df
         
         # Check DataFrame structure
         assert len(df) > 0
@@ -136,21 +131,23 @@ class TestOrbitSimulator:
         assert 'velocity' in df.columns
         assert 'below_horizon' in df.columns
         
-        # Check data types and ranges
-        assert all(0 <= az <= 360 for az in df['azimuth'] if not np.isnan(az))
-        assert all(-90 <= el <= 90 for el in df['elevation'] if not np.isnan(el))
-        assert all(r > 0 for r in df['range'] if not np.isnan(r))
-        assert all(v > 0 for v in df['velocity'] if not np.isnan(v))
+        # Check data types and ranges (NaN samples are not checked)
+        az = df['azimuth'].to_numpy()
+        el = df['elevation'].to_numpy()
+        r = df['range'].to_numpy()
+        v = df['velocity'].to_numpy()
+        assert np.logical_or(np.isnan(az), (az >= 0) & (az <= 360)).all()
+        assert np.logical_or(np.isnan(el), (el >= -90) & (el <= 90)).all()
+        assert np.logical_or(np.isnan(r), r > 0).all()
+        # Radial velocity is a range rate: signed, and bounded by LEO orbital speed
+        assert np.logical_or(np.isnan(v), np.abs(v) < 8.0).all()
         
         # Check that below_horizon flag works
-        below_horizon_mask = df['elevation'] < 0
-        assert all(df.loc[below_horizon_mask, 'below_horizon'] == True)
+        below_horizon_mask = el < 0
+        assert df['below_horizon'].to_numpy()[below_horizon_mask].all()
     
     def test_simulate_flyby_invalid_ground_station(self, temp_tle_file):
         """Test simulation with invalid ground station coordinates"""
-        if not SKYFIELD_AVAILABLE:
-            pytest.skip("Skyfield not available")
-        
         # Invalid ground station (non-numeric coordinates)
         invalid_gs = {
             'latitude_deg': 'invalid',
@@ -166,9 +163,6 @@ class TestOrbitSimulator:
     
     def test_simulate_flyby_invalid_tle(self, temp_config_file):
         """Test simulation with invalid TLE data"""
-        if not SKYFIELD_AVAILABLE:
-            pytest.skip("Skyfield not available")
-        
         gs, sim = load_config(temp_config_file)
         
         # Invalid TLE lines
@@ -177,15 +171,9 @@ class TestOrbitSimulator:
         with pytest.raises(ValueError, match="Invalid TLE"):
             simulate_flyby(gs, sim, invalid_tle)
     
-    def test_satellite_below_horizon(self, temp_tle_file, temp_config_file):
+    def test_satellite_below_horizon(self, flyby_df):
         """Test handling of satellite below horizon"""
-        if not SKYFIELD_AVAILABLE:
-            pytest.skip("Skyfield not available")
-        
-        gs, sim = load_config(temp_config_file)
-        tle_lines = load_tle(temp_tle_file)
-        
-        df = simulate_flyby(gs, sim, tle_lines)
+        df = flyby_df
         
         # Check that below_horizon flag is correctly set
         below_horizon_count = df['below_horizon'].sum()
@@ -197,34 +185,21 @@ class TestOrbitSimulator:
         # Check that below horizon entries have negative elevation
         below_horizon_data = df[df['below_horizon'] == True]
         if len(below_horizon_data) > 0:
-            assert all(below_horizon_data['elevation'] < 0)
+            assert (below_horizon_data['elevation'].to_numpy() < 0).all()
     
-    def test_time_formatting(self, temp_tle_file, temp_config_file):
+    def test_time_formatting(self, flyby_df):
         """Test that time column is properly formatted"""
-        if not SKYFIELD_AVAILABLE:
-            pytest.skip("Skyfield not available")
+        df = flyby_df
         
-        gs, sim = load_config(temp_config_file)
-        tle_lines = load_tle(temp_tle_file)
-        
-        df = simulate_flyby(gs, sim, tle_lines)
-        
-        # Check time format (should be YYYY-MM-DD HH:MM:SS)
-        for time_str in df['time']:
-            try:
-                datetime.strptime(time_str, '%Y-%m-%d %H:%M:%S')
-            except ValueError:
-                pytest.fail(f"Invalid time format: {time_str}")
+        # Check time format (should be YYYY-MM-DD HH:MM:SS strings)
+        assert pd.api.types.is_string_dtype(df['time'])
+        parsed = pd.to_datetime(df['time'], format='%Y-%m-%d %H:%M:%S', errors='coerce', cache=True)
+        assert parsed.notna().all(), f"Invalid time format: {df['time'][parsed.isna()].tolist()}"
     
-    def test_simulation_duration(self, temp_tle_file, temp_config_file):
+    def test_simulation_duration(self, temp_config_file, flyby_df):
         """Test that simulation generates correct number of data points"""
-        if not SKYFIELD_AVAILABLE:
-            pytest.skip("Skyfield not available")
-        
         gs, sim = load_config(temp_config_file)
-        tle_lines = load_tle(temp_tle_file)
-        
-        df = simulate_flyby(gs, sim, tle_lines)
+        df = flyby_df
         
         # Expected number of points: duration / time_step + 1
         expected_points = (sim['duration_sec'] // sim['time_step_sec']) + 1
@@ -0,0 +1,73 @@
+"""
+Property-based tests for signal_model.py
+Each example feeds a whole input vector to the vectorized signal functions (requires Hypothesis)
+"""
+import pytest
+import sys
+import os
+import numpy as np
+
+# Hypothesis is optional; without it this module is skipped
+pytest.importorskip("hypothesis")
+from hypothesis import given, settings, strategies as st
+from hypothesis.extra.numpy import arrays
+
+# Repository root, for running this file directly (pytest.ini adds it for pytest runs)
+_PARENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PARENT_DIR not in sys.path:
+    sys.path.insert(0, _PARENT_DIR)
+
+from flyby_model.signal_model import (
+    calculate_doppler_shift, calculate_path_loss,
+    calculate_thermal_noise, calculate_atmospheric_attenuation
+)
+
+# One vectorized call per example, so a few examples cover many inputs
+PROPERTY_SETTINGS = settings(max_examples=25, deadline=None)
+
+
+def vectors(min_value, max_value):
+    """Float64 vectors of 2-64 finite elements in [min_value, max_value]"""
+    return arrays(np.float64, shape=st.integers(2, 64),
+                  elements=st.floats(min_value, max_value))
+
+
+class TestSignalModelProperties:
+    """Property-based tests for the vectorized signal calculations"""
+    
+    @PROPERTY_SETTINGS
+    @given(vectors(1e-3, 1e5))
+    def test_path_loss_positive_monotone(self, ranges):
+        """Path loss is positive and never decreases with range"""
+        losses = calculate_path_loss(np.sort(ranges), 2400000000)
+        assert np.all(losses > 0)
+        assert np.all(np.diff(losses) >= 0)
+    
+    @PROPERTY_SETTINGS
+    @given(vectors(-100.0, 100.0))
+    def test_doppler_shift_sign(self, velocities):
+        """Doppler shift has the sign of the radial velocity and grows with it"""
+        velocities = np.sort(velocities)
+        doppler = calculate_doppler_shift(velocities, 2400000000)
+        assert np.all(np.isfinite(doppler))
+        assert np.all(np.sign(doppler) * np.sign(velocities) >= 0)  # never opposite
+        # Exact sign match above 1 mm/s (tinier velocities may underflow to 0 Hz)
+        moving = np.abs(velocities) >= 1e-6
+        assert np.array_equal(np.sign(doppler[moving]), np.sign(velocities[moving]))
+        assert np.all(np.diff(doppler) >= 0)
+    
+    @PROPERTY_SETTINGS
+    @given(vectors(1.0, 1e9))
+    def test_thermal_noise_monotone(self, bandwidths):
+        """Thermal noise never decreases with bandwidth"""
+        noise = calculate_thermal_noise(np.sort(bandwidths))
+        assert np.all(np.isfinite(noise))
+        assert np.all(np.diff(noise) >= 0)
+    
+    @PROPERTY_SETTINGS
+    @given(vectors(-90.0, 90.0), st.floats(0.0, 1e5))
+    def test_atmospheric_attenuation_threshold(self, elevations, range_km):
+        """Attenuation is non-negative, and zero at or above 10° elevation"""
+        att = calculate_atmospheric_attenuation(elevations, range_km)
+        assert np.all(att >= 0)
+        assert np.all(att[elevations >= 10] == 0.0)
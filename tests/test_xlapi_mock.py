@@ -0,0 +1,157 @@
+"""
+Test suite for xlapi_mock.py module
+Tests the SPSC ring buffer (wraparound, overflow, Full/Empty, wakeup) and XLAPI producers
+"""
+import pytest
+import sys
+import os
+import queue
+import threading
+import time
+
+# Repository root, for running this file directly (pytest.ini adds it for pytest runs)
+_PARENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PARENT_DIR not in sys.path:
+    sys.path.insert(0, _PARENT_DIR)
+
+from api_interface import xlapi_mock
+from api_interface.xlapi_mock import SPSCRingBuffer, XLAPI, QUEUE_CAPACITY
+
+
+def _drain(ring):
+    """Pop every queued item without waiting"""
+    items = []
+    while not ring.empty():
+        items.append(ring.get(timeout=0))
+    return items
+
+
+class TestSPSCRingBuffer:
+    """Test class for the ring buffer behind the XLAPI streams"""
+    
+    def test_fifo_across_wraparound(self):
+        """Items come out in order while the indices wrap several times"""
+        ring = SPSCRingBuffer(capacity=4)
+        received = []
+        for i in range(0, 30, 3):
+            for j in range(i, i + 3):
+                ring.put(j)
+            received.extend(_drain(ring))
+        
+        assert received == list(range(30))
+        assert ring.qsize() == 0
+    
+    def test_full_ring_spills_instead_of_refusing(self):
+        """A full ring accepts more items and keeps FIFO order through the overflow"""
+        ring = SPSCRingBuffer(capacity=4)
+        for i in range(6):
+            ring.put(i)
+        assert ring.qsize() == 6
+        
+        # A put after a partial drain still queues behind the spilled items
+        assert ring.get(timeout=0) == 0
+        ring.put(6)
+        
+        assert _drain(ring) == list(range(1, 7))
+        assert ring.empty()
+    
+    def test_maxsize_raises_full(self):
+        """queue.Full is raised only once maxsize items are queued"""
+        ring = SPSCRingBuffer(capacity=2, maxsize=3)
+        for i in range(3):
+            ring.put(i)
+        
+        with pytest.raises(queue.Full):
+            ring.put(3)
+        assert _drain(ring) == [0, 1, 2]
+    
+    @pytest.mark.parametrize("timeout", [0, 0.05], ids=["no_wait", "short_wait"])
+    def test_get_timeout_raises_empty(self, timeout):
+        """get() on an empty ring raises queue.Empty once the timeout expires"""
+        ring = SPSCRingBuffer(capacity=4)
+        
+        start = time.monotonic()
+        with pytest.raises(queue.Empty):
+            ring.get(timeout=timeout)
+        assert time.monotonic() - start >= timeout
+    
+    def test_blocked_get_wakes_on_put(self):
+        """A consumer waiting in get() receives an item put from another thread"""
+        ring = SPSCRingBuffer(capacity=4)
+        received = []
+        consumer = threading.Thread(target=lambda: received.append(ring.get(timeout=5)))
+        consumer.start()
+        time.sleep(0.05)  # let the consumer block on the empty ring
+        ring.put('sample')
+        consumer.join(timeout=5)
+        
+        assert not consumer.is_alive()
+        assert received == ['sample']
+    
+    def test_concurrent_producer_consumer(self):
+        """One producer and one consumer thread pass every item through a small ring in order"""
+        ring = SPSCRingBuffer(capacity=8)
+        n_items = 5000
+        received = []
+        
+        def consume():
+            for _ in range(n_items):
+                received.append(ring.get(timeout=5))
+        
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        for i in range(n_items):
+            ring.put(i)
+        consumer.join(timeout=10)
+        
+        assert received == list(range(n_items))
+
+
+class TestXLAPI:
+    """Test class for the XLAPI producer methods"""
+    
+    @pytest.fixture
+    def api(self, tmp_path, monkeypatch):
+        """XLAPI instance logging to a temporary file"""
+        monkeypatch.setattr(xlapi_mock, 'LOG_PATH', str(tmp_path / 'api_log.txt'))
+        return XLAPI()
+    
+    def test_send_beyond_capacity_without_consumer(self, api):
+        """Sends past the ring capacity are accepted, not refused"""
+        n_items = QUEUE_CAPACITY + 10
+        accepted = [api.send_signal_data(i, 0.0, 20.0) for i in range(n_items)]
+        
+        assert all(accepted)
+        assert api.signal_queue.qsize() == n_items
+        assert api.signal_queue.get(timeout=0)['time'] == 0
+    
+    def test_multiple_producer_threads(self, api):
+        """Concurrent senders lose no items and keep each sender's order"""
+        n_threads, n_items = 4, 500
+        
+        def produce(thread_id):
+            for i in range(n_items):
+                api.set_antenna(thread_id, i % 90)
+        
+        producers = [threading.Thread(target=produce, args=(k,)) for k in range(n_threads)]
+        for producer in producers:
+            producer.start()
+        for producer in producers:
+            producer.join()
+        
+        items = _drain(api.antenna_queue)
+        assert len(items) == n_threads * n_items
+        for k in range(n_threads):
+            assert [item['elevation'] for item in items if item['azimuth'] == k] == \
+                [i % 90 for i in range(n_items)]
+    
+    def test_invalid_inputs_rejected(self, api):
+        """Invalid values are refused and never reach the queues"""
+        assert not api.send_signal_data(0, 0.0, -1.0)
+        assert not api.set_antenna(400, -10)
+        assert api.signal_queue.empty()
+        assert api.antenna_queue.empty()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])